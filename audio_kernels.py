@@ -0,0 +1,58 @@
+"""
+Shared audio kernels for the meter scripts
+Fuses the per-chunk RMS + threshold + meter-level computation into one pass
+"""
+
+import numpy as np
+
+# Optional Numba JIT - LLVM auto-vectorizes the multiply-accumulate loop
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+
+def _rms_and_level_numpy(buf, max_volume, meter_width, threshold):
+    """Pure NumPy fallback when Numba is not installed"""
+    n = buf.shape[0]
+    if n == 0:
+        return 0.0, 0, False
+    buf = buf.astype(np.float64, copy=False)
+    volume = float(np.sqrt(np.dot(buf, buf) / n))
+    level = min(int(volume / max_volume * meter_width), meter_width)
+    return volume, level, volume > threshold
+
+
+if njit is not None:
+    # Explicit signature: compiles at import (no first-call type inference)
+    # and fixes the input as a C-contiguous int16 chunk, so LLVM can unroll
+    # and vectorize against a known layout. readonly=True also admits the
+    # immutable arrays np.frombuffer builds from PyAudio bytes.
+    _SIGNATURE = types.Tuple((types.float64, types.int64, types.boolean))(
+        types.Array(types.int16, 1, 'C', readonly=True),
+        types.float64,
+        types.int64,
+        types.float64,
+    )
+
+    @njit(_SIGNATURE, cache=True, fastmath=True, boundscheck=False)
+    def rms_and_level(buf, max_volume, meter_width, threshold):
+        """Compute (rms_volume, meter_level, is_speaking) for one audio chunk
+
+        Single scalar loop over the int16 samples so no temporary arrays
+        are allocated; cache=True avoids recompiling on every run.
+        """
+        acc = 0.0
+        n = buf.shape[0]
+        if n == 0:
+            return 0.0, 0, False
+        for i in range(n):
+            v = float(buf[i])
+            acc += v * v
+        volume = (acc / n) ** 0.5
+        level = int(volume / max_volume * meter_width)
+        if level > meter_width:
+            level = meter_width
+        return volume, level, volume > threshold
+else:
+    rms_and_level = _rms_and_level_numpy
@@ -4,7 +4,6 @@ Audio Meter - Real-time audio level monitoring for voice control system
 Shows visual audio meter in command line to help with microphone setup
 """
 
-import asyncio
 import logging
 import sys
 import os
@@ -15,10 +14,64 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from config import Config
+from audio_kernels import rms_and_level
 import pyaudio
 import numpy as np
 import threading
-from queue import Queue, Empty
+
+class _SPSCRingBuffer:
+    """Lock-free single-producer/single-consumer ring of audio chunks
+
+    The PyAudio callback thread is the only writer and the monitor loop is
+    the only reader, so plain int stores (atomic under the GIL) hand chunks
+    across threads without a mutex or condition variable. Chunks are dropped
+    on overflow rather than ever blocking the audio callback.
+    """
+
+    def __init__(self, chunk_size, n_buffers=32):
+        self._slots = np.empty((n_buffers, chunk_size), dtype=np.int16)
+        self._lengths = np.zeros(n_buffers, dtype=np.int32)
+        self._n = n_buffers
+        self._head = 0  # next slot to write (producer only)
+        self._tail = 0  # next slot to read (consumer only)
+
+    def push(self, data):
+        """Producer side: store one chunk, dropping it if the ring is full"""
+        head = self._head
+        if head - self._tail >= self._n:
+            return False
+        buf = np.frombuffer(data, dtype=np.int16)
+        n = min(buf.shape[0], self._slots.shape[1])
+        slot = head % self._n
+        self._slots[slot, :n] = buf[:n]
+        self._lengths[slot] = n
+        self._head = head + 1
+        return True
+
+    def pop(self):
+        """Consumer side: return the oldest chunk, or None if empty"""
+        tail = self._tail
+        if tail == self._head:
+            return None
+        slot = tail % self._n
+        chunk = self._slots[slot, :self._lengths[slot]].copy()
+        self._tail = tail + 1
+        return chunk
+
+    def pop_latest(self):
+        """Consumer side: drop any backlog and return only the newest chunk
+
+        If the consumer ever falls behind the audio callback, displaying the
+        backlog would show audio from further and further in the past; for a
+        live meter the stale chunks are worthless, so skip straight to the
+        newest one.
+        """
+        chunk = None
+        while True:
+            newer = self.pop()
+            if newer is None:
+                return chunk
+            chunk = newer
 
 class AudioMeter:
     def __init__(self, config_file="config.yaml"):
@@ -36,14 +89,20 @@ class AudioMeter:
         
         # Audio processing
         self.audio = pyaudio.PyAudio()
-        self.audio_queue = Queue()
+        self.audio_queue = _SPSCRingBuffer(self.chunk_size)
         self.is_monitoring = False
         self.stream = None
         
         # Display settings
         self.meter_width = 50
         self.max_volume = 5000  # Adjust based on your microphone
-        
+
+        # Precomputed full-width bars; each frame is then a slice + concat
+        # instead of two str.__mul__ allocations
+        self._bar_full = "█" * self.meter_width
+        self._bar_med = "▓" * self.meter_width
+        self._bar_dim = "░" * self.meter_width
+
     def __del__(self):
         """Cleanup audio resources"""
         if hasattr(self, 'audio'):
@@ -52,17 +111,9 @@ class AudioMeter:
     def _audio_callback(self, in_data, frame_count, time_info, status):
         """Callback for audio stream"""
         if self.is_monitoring:
-            self.audio_queue.put(in_data)
+            self.audio_queue.push(in_data)
         return (None, pyaudio.paContinue)
     
-    def _calculate_volume(self, audio_data):
-        """Calculate RMS volume of audio data"""
-        try:
-            audio_np = np.frombuffer(audio_data, dtype=np.int16)
-            return np.sqrt(np.mean(audio_np**2))
-        except:
-            return 0
-    
     def list_audio_devices(self):
         """List available audio input devices"""
         print("\\n📋 Available Audio Input Devices:")
@@ -125,21 +176,15 @@ class AudioMeter:
             self.stream.stop_stream()
             self.stream.close()
         
-        # Clear queue
-        while not self.audio_queue.empty():
-            try:
-                self.audio_queue.get_nowait()
-            except Empty:
-                break
+        # Clear ring buffer
+        while self.audio_queue.pop() is not None:
+            pass
     
-    def _create_meter_display(self, volume, is_speaking):
+    def _create_meter_display(self, volume, level, is_speaking):
         """Create visual meter display"""
-        # Calculate meter level (0 to meter_width)
-        level = min(int((volume / self.max_volume) * self.meter_width), self.meter_width)
-        
-        # Create meter bar
-        meter_char = "█" if is_speaking else "▓"
-        meter = meter_char * level + "░" * (self.meter_width - level)
+        # Create meter bar from the precomputed strings
+        filled = self._bar_full if is_speaking else self._bar_med
+        meter = filled[:level] + self._bar_dim[level:]
         
         # Status indicator
         status = "🟢 SPEAKING" if is_speaking else "🔴 SILENT "
@@ -149,32 +194,40 @@ class AudioMeter:
         
         return f"{status} |{meter}| {volume_pct:3d}% (Vol: {int(volume):4d})"
     
-    async def monitor_loop(self):
-        """Main monitoring loop"""
+    def monitor_loop(self):
+        """Main monitoring loop
+
+        Runs synchronously on the calling thread: the PyAudio callback fills
+        the queue from its own thread, so a blocking get() is all the
+        concurrency this needs - no event loop required.
+        """
         try:
             while self.is_monitoring:
-                try:
-                    # Get audio data with timeout
-                    data = self.audio_queue.get(timeout=0.1)
-                    volume = self._calculate_volume(data)
-                    
-                    # Check if speaking (above threshold)
-                    is_speaking = volume > self.silence_threshold
-                    
-                    # Create and display meter
-                    meter_display = self._create_meter_display(volume, is_speaking)
-                    
-                    # Clear line and print meter
-                    print(f"\\r{meter_display}", end="", flush=True)
-                    
-                except Empty:
-                    await asyncio.sleep(0.01)
+                # Get the newest chunk, discarding any backlog so the meter
+                # latency stays bounded
+                audio_np = self.audio_queue.pop_latest()
+                if audio_np is None:
+                    time.sleep(0.005)
                     continue
-                    
+
+                # Fused RMS + threshold + meter level in one pass
+                volume, level, is_speaking = rms_and_level(
+                    audio_np, float(self.max_volume), self.meter_width,
+                    float(self.silence_threshold)
+                )
+
+                # Create and display meter
+                meter_display = self._create_meter_display(volume, level, is_speaking)
+
+                # Single raw write per frame: carriage return + line,
+                # bypassing print()'s per-call text-layer overhead
+                sys.stdout.buffer.write(b"\r" + meter_display.encode())
+                sys.stdout.buffer.flush()
+
         except Exception as e:
             print(f"\\n❌ Monitoring error: {e}")
 
-async def main():
+def main():
     """Main function"""
     print("🎵 Voice Control Audio Meter")
     print("=" * 50)
@@ -206,7 +259,7 @@ async def main():
         return
     
     try:
-        await meter.monitor_loop()
+        meter.monitor_loop()
     except KeyboardInterrupt:
         print("\\n\\n🛑 Audio monitoring stopped by user")
     finally:
@@ -215,6 +268,6 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        main()
     except KeyboardInterrupt:
         print("\\n\\n👋 Goodbye!")
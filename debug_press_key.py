@@ -8,6 +8,32 @@ import logging
 import sys
 import re
 
+# Compiled once at import - re-parsing the pattern strings per call is wasted
+# work, and these mirror the patterns used per-utterance in production
+PRESS_KEY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"^press key (.+)$",           # "press key enter"
+    r"^press (.+) key$",           # "press enter key"
+    r"^hit key (.+)$",             # "hit key backspace"
+    r"^hit (.+) key$",             # "hit escape key"
+    r"^key (.+)$",                 # "key tab" (only if it's the whole phrase)
+    r"^press (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|ctrl \w+|shift \w+|alt \w+)$",  # Specific keys only
+)]
+
+# The improved patterns collapsed into one alternation so each utterance is
+# scanned once instead of once per pattern. Alternative order matters: the
+# "press key X" / bare-key forms must be tried before "press X key".
+MASTER_PATTERN = re.compile(
+    r"^(?:"
+    r"press key (?P<press_key>.+?)"
+    r"|press (?P<press_direct>enter|tab|space|escape|backspace|delete|home|end|up|down|left|right)"
+    r"|press (?P<press_suffix>.+?) key"
+    r"|hit key (?P<hit_key>.+?)"
+    r"|hit (?P<hit_suffix>.+?) key"
+    r"|key (?P<bare_key>.+?)"
+    r")\.?$",
+    re.IGNORECASE
+)
+
 def setup_logging():
     """Setup logging for debugging"""
     logging.basicConfig(
@@ -41,27 +67,18 @@ async def debug_press_key_detection():
         "hit key backspace",
     ]
     
-    # Define the patterns used in the actual code
-    press_key_patterns = [
-        r"^press key (.+)$",           # "press key enter"
-        r"^press (.+) key$",           # "press enter key"  
-        r"^hit key (.+)$",             # "hit key backspace"
-        r"^hit (.+) key$",             # "hit escape key"
-        r"^key (.+)$",                 # "key tab" (only if it's the whole phrase)
-        r"^press (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|ctrl \w+|shift \w+|alt \w+)$"  # Specific keys only
-    ]
-    
     for text in problematic_texts:
         logger.info(f"\n--- Testing: '{text}' ---")
         text_lower = text.lower().strip()
         logger.info(f"Processed text: '{text_lower}'")
-        
+
         found_match = False
-        for i, pattern in enumerate(press_key_patterns):
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for i, pattern in enumerate(PRESS_KEY_PATTERNS):
+            # All patterns are ^...$ anchored, so match() suffices
+            match = pattern.match(text_lower)
             if match:
                 key_name = match.group(1).strip()
-                logger.info(f"✅ MATCH found with pattern {i+1}: '{pattern}' -> key: '{key_name}'")
+                logger.info(f"✅ MATCH found with pattern {i+1}: '{pattern.pattern}' -> key: '{key_name}'")
                 found_match = True
                 break
         
@@ -71,30 +88,15 @@ async def debug_press_key_detection():
     # Test with better patterns that handle punctuation
     logger.info("\n🔧 Testing improved patterns...")
     
-    improved_patterns = [
-        r"press key (.+?)\.?$",        # "press key enter" or "press key enter."
-        r"press (.+?) key\.?$",        # "press enter key" or "press enter key."
-        r"hit key (.+?)\.?$",          # "hit key backspace" or "hit key backspace."
-        r"hit (.+?) key\.?$",          # "hit escape key" or "hit escape key."
-        r"^key (.+?)\.?$",             # "key tab" or "key tab."
-        r"^press (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right)\.?$"  # Direct key commands
-    ]
-    
     for text in problematic_texts:
         logger.info(f"\n--- Testing improved patterns for: '{text}' ---")
         text_lower = text.lower().strip()
-        
-        found_match = False
-        for i, pattern in enumerate(improved_patterns):
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                if match.lastindex and match.lastindex >= 1:
-                    key_name = match.group(1).strip()
-                    logger.info(f"✅ IMPROVED MATCH with pattern {i+1}: '{pattern}' -> key: '{key_name}'")
-                    found_match = True
-                    break
-        
-        if not found_match:
+
+        match = MASTER_PATTERN.match(text_lower)
+        if match:
+            key_name = match.group(match.lastgroup).strip()
+            logger.info(f"✅ IMPROVED MATCH via '{match.lastgroup}' alternative -> key: '{key_name}'")
+        else:
             logger.info(f"❌ Still no match for '{text_lower}'")
 
 if __name__ == "__main__":
@@ -15,66 +15,60 @@ try:
     import pyaudio
     import numpy as np
     import time
-    from config import Config
 except ImportError as e:
     print(f"❌ Import error: {e}")
     print("Make sure all dependencies are installed.")
     sys.exit(1)
 
-def list_audio_devices():
-    """List all available audio devices"""
+# Substrings that identify an eMeet microphone by device name. Deliberately
+# no bare 'meet': it matched false positives like "Meeting speakers".
+EMEET_NAME_HINTS = ('emeet', 'm0')
+
+def list_audio_devices(audio):
+    """List all available audio devices using a shared PyAudio instance"""
     print("🎤 Detecting Audio Devices...")
     print("=" * 60)
-    
-    audio = pyaudio.PyAudio()
-    emeet_devices = []
-    all_input_devices = []
-    
+
     try:
-        device_count = audio.get_device_count()
-        print(f"Total devices found: {device_count}\n")
-        
-        for i in range(device_count):
+        # Enumerate everything first; classification and printing happen
+        # afterwards so terminal I/O stays off the PortAudio query path
+        infos = []
+        for i in range(audio.get_device_count()):
             try:
-                info = audio.get_device_info_by_index(i)
-                name = info['name']
-                
-                # Check if it's an input device
-                if info['maxInputChannels'] > 0:
-                    all_input_devices.append((i, info))
-                    
-                    # Check if it's an eMeet device
-                    if 'emeet' in name.lower() or 'meet' in name.lower():
-                        emeet_devices.append((i, info))
-                        print(f"🎯 FOUND eMeet Device:")
-                    else:
-                        print(f"📱 Input Device:")
-                    
-                    print(f"   Index: {i}")
-                    print(f"   Name: {name}")
-                    print(f"   Max Input Channels: {info['maxInputChannels']}")
-                    print(f"   Default Sample Rate: {int(info['defaultSampleRate'])} Hz")
-                    print(f"   Host API: {info['hostApi']}")
-                    print()
-                    
+                infos.append((i, audio.get_device_info_by_index(i)))
             except Exception as e:
                 print(f"   Error reading device {i}: {e}")
-                continue
-                
     except Exception as e:
         print(f"❌ Error accessing audio system: {e}")
         return [], []
-    finally:
-        audio.terminate()
-    
+
+    print(f"Total devices found: {len(infos)}\n")
+
+    all_input_devices = [(i, info) for i, info in infos
+                         if info['maxInputChannels'] > 0]
+    emeet_devices = [(i, info) for i, info in all_input_devices
+                     if any(hint in info['name'].lower() for hint in EMEET_NAME_HINTS)]
+    emeet_indices = {i for i, _ in emeet_devices}
+
+    for i, info in all_input_devices:
+        print("🎯 FOUND eMeet Device:" if i in emeet_indices else "📱 Input Device:")
+        print(f"   Index: {i}")
+        print(f"   Name: {info['name']}")
+        print(f"   Max Input Channels: {info['maxInputChannels']}")
+        print(f"   Default Sample Rate: {int(info['defaultSampleRate'])} Hz")
+        print(f"   Host API: {info['hostApi']}")
+        print()
+
     return emeet_devices, all_input_devices
 
-def test_microphone(device_index, duration=3):
-    """Test a specific microphone for a few seconds"""
+def test_microphone(audio, device_index, duration=3):
+    """Test a specific microphone for a few seconds
+
+    Reuses the caller's PyAudio instance so each tested device only pays
+    for its own stream, not a full PortAudio init/teardown.
+    """
     print(f"\n🔊 Testing device {device_index} for {duration} seconds...")
-    
-    audio = pyaudio.PyAudio()
-    
+
     try:
         # Audio settings
         sample_rate = 16000
@@ -93,22 +87,24 @@ def test_microphone(device_index, duration=3):
         )
         
         print("🎵 Recording... (speak into the microphone)")
-        
-        volumes = []
-        for i in range(int(sample_rate * duration / chunk_size)):
-            data = stream.read(chunk_size)
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            volume = np.sqrt(np.mean(audio_data**2))
-            volumes.append(volume)
-            
-            # Simple volume meter
+
+        # One bulk read for the whole test, then vectorized per-window RMS -
+        # replaces ~47 per-chunk Python read/compute/print iterations
+        frames = stream.read(int(sample_rate * duration), exception_on_overflow=False)
+
+        stream.stop_stream()
+        stream.close()
+
+        audio_data = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+        windows = np.lib.stride_tricks.sliding_window_view(audio_data, chunk_size)[::chunk_size]
+        volumes = np.sqrt(np.mean(np.square(windows), axis=1))
+
+        # Replay the volume meter from the computed windows
+        for volume in volumes:
             level = min(int(volume / 100), 20)
             meter = "█" * level + "░" * (20 - level)
             print(f"\r   Volume: |{meter}| {int(volume):4d}", end="", flush=True)
-            
-        stream.stop_stream()
-        stream.close()
-        
+
         avg_volume = np.mean(volumes)
         max_volume = np.max(volumes)
         
@@ -128,43 +124,36 @@ def test_microphone(device_index, duration=3):
     except Exception as e:
         print(f"   ❌ Error testing microphone: {e}")
         return False
-    finally:
-        audio.terminate()
 
 def update_config_for_emeet(device_index, config_file="config.yaml"):
     """Update config file to use eMeet microphone"""
     try:
-        config = Config(config_file)
-        
-        # Update audio input device
         print(f"\n🔧 Updating config to use device {device_index}...")
-        
-        # Read current config file
-        with open(config_file, 'r') as f:
-            lines = f.readlines()
-        
-        # Update input_device line
-        updated = False
-        for i, line in enumerate(lines):
-            if 'input_device:' in line:
-                lines[i] = f"  input_device: {device_index}  # eMeet microphone\n"
-                updated = True
-                break
-        
-        if not updated:
-            # Add input_device to audio section
-            for i, line in enumerate(lines):
-                if line.strip() == 'audio:':
-                    lines.insert(i + 1, f"  input_device: {device_index}  # eMeet microphone\n")
-                    break
-        
-        # Write updated config
-        with open(config_file, 'w') as f:
-            f.writelines(lines)
-            
+
+        # Single load -> mutate -> dump pass; the old line-scanning rewrite
+        # parsed the YAML once just to throw it away and broke on any
+        # non-standard formatting. ruamel.yaml additionally preserves
+        # comments and quoting when it is installed.
+        try:
+            from ruamel.yaml import YAML
+            yaml_rt = YAML()
+            yaml_rt.preserve_quotes = True
+            with open(config_file, 'r') as f:
+                data = yaml_rt.load(f) or {}
+            data.setdefault('audio', {})['input_device'] = device_index
+            with open(config_file, 'w') as f:
+                yaml_rt.dump(data, f)
+        except ImportError:
+            import yaml
+            with open(config_file, 'r') as f:
+                data = yaml.safe_load(f) or {}
+            data.setdefault('audio', {})['input_device'] = device_index
+            with open(config_file, 'w') as f:
+                yaml.dump(data, f, default_flow_style=False)
+
         print(f"   ✅ Config updated to use device {device_index}")
         return True
-        
+
     except Exception as e:
         print(f"   ❌ Error updating config: {e}")
         return False
@@ -172,40 +161,46 @@ def update_config_for_emeet(device_index, config_file="config.yaml"):
 def main():
     print("🎯 eMeet Microphone Detection & Setup")
     print("=" * 50)
-    
-    # List all devices
-    emeet_devices, all_devices = list_audio_devices()
-    
-    if not all_devices:
-        print("❌ No audio input devices found!")
-        return
-    
-    # Handle eMeet devices
-    if emeet_devices:
-        print(f"🎉 Found {len(emeet_devices)} eMeet device(s)!")
-        
-        for device_index, info in emeet_devices:
-            print(f"\n🧪 Testing eMeet device {device_index}: {info['name']}")
-            if test_microphone(device_index):
-                response = input(f"\n❓ Use this eMeet device ({device_index}) as default? (y/n): ").strip().lower()
-                if response in ['y', 'yes']:
-                    update_config_for_emeet(device_index)
-                    print(f"\n✅ eMeet microphone configured! Device {device_index} is now the default.")
-                    break
-    else:
-        print("⚠️  No eMeet devices detected by name.")
-        print("Your eMeet microphone might be listed under a different name.")
-        print("\nLet's test all available input devices:\n")
-        
-        for device_index, info in all_devices:
-            print(f"🧪 Testing device {device_index}: {info['name']}")
-            if test_microphone(device_index):
-                response = input(f"\n❓ Is this your eMeet microphone? Use as default? (y/n): ").strip().lower()
-                if response in ['y', 'yes']:
-                    update_config_for_emeet(device_index)
-                    print(f"\n✅ Microphone configured! Device {device_index} is now the default.")
-                    break
-            print()
+
+    # One PyAudio instance shared by enumeration and all microphone tests
+    audio = pyaudio.PyAudio()
+
+    try:
+        # List all devices
+        emeet_devices, all_devices = list_audio_devices(audio)
+
+        if not all_devices:
+            print("❌ No audio input devices found!")
+            return
+
+        # Handle eMeet devices
+        if emeet_devices:
+            print(f"🎉 Found {len(emeet_devices)} eMeet device(s)!")
+
+            for device_index, info in emeet_devices:
+                print(f"\n🧪 Testing eMeet device {device_index}: {info['name']}")
+                if test_microphone(audio, device_index):
+                    response = input(f"\n❓ Use this eMeet device ({device_index}) as default? (y/n): ").strip().lower()
+                    if response in ['y', 'yes']:
+                        update_config_for_emeet(device_index)
+                        print(f"\n✅ eMeet microphone configured! Device {device_index} is now the default.")
+                        break
+        else:
+            print("⚠️  No eMeet devices detected by name.")
+            print("Your eMeet microphone might be listed under a different name.")
+            print("\nLet's test all available input devices:\n")
+
+            for device_index, info in all_devices:
+                print(f"🧪 Testing device {device_index}: {info['name']}")
+                if test_microphone(audio, device_index):
+                    response = input(f"\n❓ Is this your eMeet microphone? Use as default? (y/n): ").strip().lower()
+                    if response in ['y', 'yes']:
+                        update_config_for_emeet(device_index)
+                        print(f"\n✅ Microphone configured! Device {device_index} is now the default.")
+                        break
+                print()
+    finally:
+        audio.terminate()
 
 if __name__ == "__main__":
     try:
@@ -14,6 +14,8 @@ import pyaudio
 import numpy as np
 import time
 
+from audio_kernels import rms_and_level
+
 def simple_audio_meter():
     """Simple audio meter for eMeet M0"""
     
@@ -53,21 +55,14 @@ def simple_audio_meter():
                 # Convert to numpy array
                 audio_data = np.frombuffer(data, dtype=np.int16)
                 
-                # Calculate volume (RMS)
-                if len(audio_data) > 0:
-                    volume = np.sqrt(np.mean(audio_data.astype(np.float64)**2))
-                    
-                    # Avoid NaN
-                    if np.isnan(volume) or np.isinf(volume):
-                        volume = 0
-                else:
-                    volume = 0
-                
-                # Create visual meter (0-30 characters)
-                level = min(int(volume / 20), 30)  # Adjusted for eMeet sensitivity
-                
+                # Fused RMS + threshold + meter level in one pass
+                # (max_volume 600 = 30 chars * 20/char, adjusted for eMeet sensitivity)
+                # int16 input makes the RMS a finite non-negative float by
+                # construction, so no NaN/Inf guard is needed here.
+                volume, level, speaking = rms_and_level(audio_data, 600.0, 30, 50.0)
+
                 # Different characters for different levels
-                if volume > 50:
+                if speaking:
                     char = "█"  # High volume - speaking
                     status = "🟢 SPEAKING"
                 elif volume > 20:
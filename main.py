@@ -10,11 +10,54 @@ import sys
 import logging
 from pathlib import Path
 
-from src.voice_recognition import VoiceRecognizer
+# Optional uvloop: a faster event loop for the many small awaits the
+# command pipeline schedules. Falls back to the stdlib loop when absent
+# (uvloop does not support Windows).
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
+# VoiceRecognizer (whisper/torch) and VoiceControlGUI (tkinter) are imported
+# lazily where needed: utility paths like --list-devices and --help should
+# not pay seconds of model-framework import time
 from src.command_processor import CommandProcessor
 from src.keystroke_manager import KeystrokeManager
 from src.config import Config
-from src.gui import VoiceControlGUI
+
+def _list_input_devices():
+    """Enumerate audio input devices with PyAudio alone
+
+    Mirrors VoiceRecognizer.list_audio_devices() but without importing the
+    recognizer, so device listing stays off the whisper/torch import path.
+    """
+    import pyaudio
+    audio = pyaudio.PyAudio()
+    try:
+        devices = []
+        for i in range(audio.get_device_count()):
+            info = audio.get_device_info_by_index(i)
+            if info['maxInputChannels'] > 0:
+                devices.append({
+                    'index': i,
+                    'name': info['name'],
+                    'channels': info['maxInputChannels'],
+                    'sample_rate': info['defaultSampleRate']
+                })
+        return devices
+    finally:
+        audio.terminate()
+
+def _format_device_list(devices):
+    """Build the device listing as one string so it reaches the terminal
+    in a single write instead of four print calls per device"""
+    lines = ["\n🎤 Available Audio Input Devices:", "-" * 60]
+    for device in devices:
+        lines.append(f"{device['index']:2d}: {device['name']}")
+        lines.append(f"    Channels: {device['channels']}, Sample Rate: {int(device['sample_rate'])} Hz")
+    lines.append("-" * 60)
+    return "\n".join(lines)
 
 def setup_logging(log_level="INFO"):
     """Setup logging configuration"""
@@ -49,16 +92,7 @@ async def main():
     
     # Handle device listing
     if args.list_devices:
-        config = Config(args.config)
-        recognizer = VoiceRecognizer(config)
-        devices = recognizer.list_audio_devices()
-        
-        print("\n🎤 Available Audio Input Devices:")
-        print("-" * 60)
-        for device in devices:
-            print(f"{device['index']:2d}: {device['name']}")
-            print(f"    Channels: {device['channels']}, Sample Rate: {int(device['sample_rate'])} Hz")
-        print("-" * 60)
+        print(_format_device_list(_list_input_devices()))
         print("Use --device <number> to select a specific device")
         return
     
@@ -69,7 +103,7 @@ async def main():
         # Set audio device if specified
         if args.device is not None:
             config.set('audio.input_device', args.device)
-            logger.info(f"Using audio device: {args.device}")
+            logger.info("Using audio device: %s", args.device)
         
         # CLI device selection if in CLI mode and no device specified
         if args.mode == 'cli' and args.device is None:
@@ -78,12 +112,14 @@ async def main():
                 config.set('audio.input_device', selected_device)
         
         # Initialize components
+        from src.voice_recognition import VoiceRecognizer
         voice_recognizer = VoiceRecognizer(config)
         keystroke_manager = KeystrokeManager()
         command_processor = CommandProcessor(config, keystroke_manager)
         
         if args.mode == 'gui':
             # Run GUI mode
+            from src.gui import VoiceControlGUI
             gui = VoiceControlGUI(voice_recognizer, command_processor, config)
             await gui.run()
         else:
@@ -98,7 +134,7 @@ async def main():
                 await run_command_mode(voice_recognizer, command_processor)
                 
     except Exception as e:
-        logger.error(f"Application error: {e}")
+        logger.error("Application error: %s", e)
         sys.exit(1)
 
 async def run_dictation_mode(voice_recognizer, keystroke_manager):
@@ -109,7 +145,7 @@ async def run_dictation_mode(voice_recognizer, keystroke_manager):
     try:
         async for text in voice_recognizer.continuous_recognition():
             if text.strip():
-                logger.info(f"Dictating: {text}")
+                logger.info("Dictating: %s", text)
                 await keystroke_manager.type_text(text)
     except KeyboardInterrupt:
         logger.info("Dictation mode stopped by user")
@@ -123,8 +159,8 @@ async def run_enhanced_dictation_mode(voice_recognizer, command_processor):
     try:
         async for text in voice_recognizer.continuous_recognition():
             if text.strip():
-                logger.info(f"Processing: {text}")
-                await command_processor.process_command(text)
+                logger.info("Processing: %s", text)
+                await command_processor.enqueue(text)
     except KeyboardInterrupt:
         logger.info("Enhanced dictation mode stopped by user")
 
@@ -136,7 +172,7 @@ async def run_command_mode(voice_recognizer, command_processor):
     try:
         async for text in voice_recognizer.continuous_recognition():
             if text.strip():
-                await command_processor.process_command(text)
+                await command_processor.enqueue(text)
     except KeyboardInterrupt:
         logger.info("Command mode stopped by user")
 
@@ -144,20 +180,15 @@ async def select_audio_device_cli(config):
     """CLI function to select audio device interactively"""
     
     try:
-        recognizer = VoiceRecognizer(config)
-        devices = recognizer.list_audio_devices()
-        
+        devices = _list_input_devices()
+
+
         if not devices:
             print("❌ No audio input devices found!")
             return None
         
-        print("\n🎤 Available Audio Input Devices:")
-        print("-" * 60)
-        for device in devices:
-            print(f"{device['index']:2d}: {device['name']}")
-            print(f"    Channels: {device['channels']}, Sample Rate: {int(device['sample_rate'])} Hz")
-        print("-" * 60)
-        
+        print(_format_device_list(devices))
+
         # Auto-detect eMeet microphone
         emeet_device = None
         for device in devices:
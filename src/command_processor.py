@@ -4,14 +4,108 @@ Handles interpretation and execution of voice commands
 """
 
 import asyncio
+import concurrent.futures
+import functools
 import logging
 import re
-import subprocess
-import webbrowser
-from typing import Dict, List, Optional, Callable, Any
-from dataclasses import dataclass
+import shlex
+import shutil
+import types
+from urllib.parse import urlencode
+from typing import Dict, List, Mapping, Optional, Callable, Any, Tuple
+from dataclasses import dataclass, field
 import platform
 
+# Optional Aho-Corasick automaton for the literal-pattern prefilter
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# The host OS never changes while the process runs; resolve it once at
+# import instead of calling platform.system() in every handler
+_SYSTEM = platform.system().lower()
+
+# Window-management chords follow from the OS, so pick them once here
+# instead of branching inside the handlers
+_MINIMIZE_COMBO = "win+down" if _SYSTEM == "windows" else "ctrl+alt+9"
+_MAXIMIZE_COMBO = "win+up" if _SYSTEM == "windows" else "ctrl+alt+0"
+
+# Per-platform argv builders, specialized once at import so the
+# application handlers carry no runtime branching
+if _SYSTEM == "darwin":
+    def _open_app_argv(app_name):
+        return ("open", "-a", app_name)
+else:  # linux / windows: launch by resolved binary
+    _app_path_cache: Dict[str, str] = {}
+
+    def _open_app_argv(app_name):
+        # Whisper capitalizes ("Open Firefox." -> "Firefox") but binaries
+        # on a case-sensitive PATH are almost always lowercase, so try the
+        # spoken casing first and fall back to the folded name. Resolution
+        # is cached so repeat launches skip the per-directory stat walk;
+        # an unresolved name passes through folded and fails in the
+        # handler's usual error path.
+        key = app_name.lower()
+        path = _app_path_cache.get(key)
+        if path is None:
+            path = shutil.which(app_name) or shutil.which(key) or key
+            _app_path_cache[key] = path
+        return (path,)
+
+if _SYSTEM == "windows":
+    def _close_app_argv(app_name):
+        return ("taskkill", "/f", "/im", f"{app_name}.exe")
+else:  # linux / macOS
+    def _close_app_argv(app_name):
+        # pkill -f matches the lowercase process name, not Whisper's casing
+        return ("pkill", "-f", app_name.lower())
+
+# Characters that mark a pattern as a regex rather than a literal phrase
+_REGEX_METACHARS = set('.^$*+?{}[]\\|()')
+
+
+# Exact "press <key>"/"hit <key>" phrases for the keys the direct-command
+# patterns accept (minus the open-ended f\d+), resolved by dict lookup
+# before any regex runs
+_DIRECT_KEY_PHRASES = {
+    f"{verb} {key}": key
+    for verb in ('press', 'hit')
+    for key in ('enter', 'tab', 'space', 'escape', 'backspace', 'delete',
+                'home', 'end', 'up', 'down', 'left', 'right',
+                'page up', 'page down')
+}
+
+# Patterns for "press key" commands during dictation, specific enough to
+# avoid false positives and tolerant of trailing punctuation. Compiled once
+# at import; the flag marks the modifier forms ("press ctrl c") whose two
+# groups combine into one key name.
+_PRESS_KEY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), is_modifier)
+    for pattern, is_modifier in [
+        (r"press key (.+?)\.?$", False),        # "press key enter" or "press key enter."
+        (r"press (.+?) key\.?$", False),        # "press enter key" or "press enter key."
+        (r"hit key (.+?)\.?$", False),          # "hit key backspace" or "hit key backspace."
+        (r"hit (.+?) key\.?$", False),          # "hit escape key" or "hit escape key."
+        (r"^key (.+?)\.?$", False),             # "key tab" or "key tab."
+        (r"^press (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|page up|page down|f\d+)\.?$", False),  # Direct key commands
+        (r"^hit (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|page up|page down|f\d+)\.?$", False),    # "hit enter", "hit tab", etc.
+        (r"press (ctrl|shift|alt) (.+?)\.?$", True),  # "press ctrl c", "press shift tab", etc.
+        (r"hit (ctrl|shift|alt) (.+?)\.?$", True),    # "hit ctrl c", "hit shift tab", etc.
+    ]
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_webbrowser():
+    """Import webbrowser on first browser command
+
+    Keeps default-browser resolution off the module import path and does
+    it only once, not per call.
+    """
+    import webbrowser
+    return webbrowser
+
 @dataclass
 class Command:
     """Data class for command definition"""
@@ -20,8 +114,24 @@ class Command:
     handler: Callable
     description: str
     category: str = "general"
+    # Handlers that only enqueue keystrokes are cheap enough to invoke
+    # inline on the event-loop thread, skipping the executor round-trip
+    fast_sync: bool = False
+    # Non-blocking handlers (browser/app launches, help output) run as
+    # fire-and-forget tasks so the ASR loop never waits on them
+    blocking: bool = True
+    # (compiled_pattern, is_regex, literal) triples built once at
+    # registration so the dispatch hot path never re-compiles anything
+    matchers: List[Tuple] = field(default_factory=list, repr=False, compare=False)
+    # Whether the handler is a coroutine function, checked once at
+    # registration instead of via reflection on every dispatch
+    is_async: bool = field(default=False, compare=False)
 
 class CommandProcessor:
+    # How long buffered dictation text may wait for more segments before
+    # it is typed out
+    _DICTATION_FLUSH_DELAY = 0.02
+
     def __init__(self, config, keystroke_manager):
         self.config = config
         self.keystroke_manager = keystroke_manager
@@ -30,16 +140,55 @@ class CommandProcessor:
         # Command state
         self.dictation_mode = False
         self.listening_for_commands = True
+
+        # Dispatch plumbing: the running loop is cached on first use, and
+        # sync handlers share one small thread pool instead of spawning
+        # default-executor threads per dispatch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="cmd"
+        )
+        # Strong references to fire-and-forget handler tasks
+        self._bg_tasks: set = set()
+
+        # Lock-screen implementation bound once per platform
+        self._lock_screen_impl = {
+            "windows": self._lock_screen_windows,
+            "darwin": self._lock_screen_darwin,
+        }.get(_SYSTEM, self._lock_screen_linux)
+
+        # Bounded hand-off between the recognizer and command dispatch so
+        # the ASR loop never blocks behind a slow handler
+        self._cmd_queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self._worker: Optional[asyncio.Task] = None
+
+        # Dictation output coalescing: utterances collect here briefly so a
+        # burst of recognized segments becomes one batched type_text call
+        self._dictation_buf: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
         
         # Wake words and stop words
         self.wake_words = config.get('commands.wake_words', ['activate', 'computer', 'hey assistant'])
         self.stop_dictation_words = config.get('commands.stop_dictation', ['stop dictation', 'end dictation'])
         self.start_dictation_words = config.get('commands.start_dictation', ['start dictation', 'begin dictation'])
+
+        # Compiled alternations: one C-level scan per utterance instead of a
+        # Python loop of per-phrase substring checks
+        self._wake_re = self._compile_phrase_alternation(self.wake_words)
+        self._stop_dictation_re = self._compile_phrase_alternation(self.stop_dictation_words)
         
         # Initialize command registry
         self.commands: Dict[str, Command] = {}
+        # Maintained incrementally by _register_command so category views
+        # never have to walk the whole registry
+        # Plain dict, not defaultdict: get_commands_by_category hands out a
+        # read-only proxy of this, and a defaultdict would let mere lookups
+        # through the proxy insert empty categories
+        self._category_index: Dict[str, List[Command]] = {}
+        self._help_text: Optional[str] = None
         self._register_default_commands()
         self._load_custom_commands()
+        self._build_dispatch_index()
         
     def _register_default_commands(self):
         """Register default system commands"""
@@ -64,15 +213,16 @@ class CommandProcessor:
         # Application control
         self._register_command(Command(
             "open_application",
-            [r"open (\w+)", r"launch (\w+)", r"start (\w+)"],
+            [r"^open (\w+)\b", r"^launch (\w+)\b", r"^start (\w+)\b"],
             self._open_application,
             "Open an application",
-            "applications"
+            "applications",
+            blocking=False
         ))
         
         self._register_command(Command(
             "close_application",
-            [r"close (\w+)", r"quit (\w+)", r"exit (\w+)"],
+            [r"^close (\w+)\b", r"^quit (\w+)\b", r"^exit (\w+)\b"],
             self._close_application,
             "Close an application",
             "applications"
@@ -81,18 +231,20 @@ class CommandProcessor:
         # Browser control
         self._register_command(Command(
             "open_website",
-            [r"open website (.+)", r"go to (.+)", r"browse (.+)", r"visit (.+)"],
+            [r"^open website (.+)", r"go to (.+)", r"^browse (.+)", r"^visit (.+)"],
             self._open_website,
             "Open a website in browser",
-            "browser"
+            "browser",
+            blocking=False
         ))
         
         self._register_command(Command(
             "search_web",
-            [r"search for (.+)", r"google (.+)", r"look up (.+)"],
+            [r"^search for (.+)", r"^google (.+)", r"^look up (.+)"],
             self._search_web,
             "Search the web",
-            "browser"
+            "browser",
+            blocking=False
         ))
         
         # Window management
@@ -124,53 +276,59 @@ class CommandProcessor:
         self._register_command(Command(
             "copy",
             ["copy", "copy text"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+c"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+c"),
             "Copy selected text",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "paste",
             ["paste", "paste text"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+v"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+v"),
             "Paste text",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "cut",
             ["cut", "cut text"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+x"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+x"),
             "Cut selected text",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "undo",
             ["undo", "undo that"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+z"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+z"),
             "Undo last action",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))        
         self._register_command(Command(
             "redo",
             ["redo", "redo that"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+y"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+y"),
             "Redo last action",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "select_all",
             ["select all", "select everything"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+a"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+a"),
             "Select all text",
-            "shortcuts"
+            "shortcuts",
+            fast_sync=True
         ))        
         # Text input
         self._register_command(Command(
             "type_text",
-            [r"type (.+)", r"write (.+)", r"input (.+)"],
+            [r"^type (.+)", r"^write (.+)", r"^input (.+)"],
             self._type_text,
             "Type the specified text",
             "text"
@@ -180,25 +338,28 @@ class CommandProcessor:
         self._register_command(Command(
             "new_tab",
             ["new tab", "open tab"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+t"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+t"),
             "Open new tab",
-            "navigation"
+            "navigation",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "close_tab",
             ["close tab"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+w"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+w"),
             "Close current tab",
-            "navigation"
+            "navigation",
+            fast_sync=True
         ))
         
         self._register_command(Command(
             "next_tab",
             ["next tab", "switch tab"],
-            lambda: self.keystroke_manager.send_key_combination("ctrl+tab"),
+            functools.partial(self.keystroke_manager.send_key_combination, "ctrl+tab"),
             "Switch to next tab",
-            "navigation"
+            "navigation",
+            fast_sync=True
         ))
         
         # System control
@@ -216,7 +377,8 @@ class CommandProcessor:
             ["help", "show commands", "what can you do"],
             self._show_help,
             "Show available commands",
-            "help"
+            "help",
+            blocking=False
         ))
         
         self._register_command(Command(
@@ -226,16 +388,7 @@ class CommandProcessor:
             "Show current status",
             "help"
         ))
-    
-        # Text input commands
-        self._register_command(Command(
-            "type_text",
-            [r"type (.+)", r"write (.+)", r"input (.+)"],
-            self._type_text,
-            "Type the specified text",
-            "input"
-        ))
-        
+
         self._register_command(Command(
             "press_key",
             [r"press (.+)", r"hit (.+)", r"key (.+)"],
@@ -244,10 +397,36 @@ class CommandProcessor:
             "input"
         ))
         
+    @staticmethod
+    def _compile_phrase_alternation(phrases: List[str]):
+        """Compile a word-boundary alternation matching any of the phrases"""
+        if not phrases:
+            return None
+        joined = "|".join(re.escape(p) for p in phrases)
+        return re.compile(r"\b(?:" + joined + r")\b", re.IGNORECASE)
+
+    @staticmethod
+    def _build_matcher(pattern: str) -> Tuple:
+        """Build a precompiled matcher for a single pattern
+
+        Regex patterns are compiled once here; literal phrases are stored
+        lowercased for a plain substring check on the hot path.
+        """
+        if _REGEX_METACHARS.intersection(pattern):
+            return (re.compile(pattern, re.IGNORECASE), True, None)
+        return (None, False, pattern.lower())
+
     def _register_command(self, command: Command):
         """Register a command in the command registry"""
+        command.matchers = [self._build_matcher(p) for p in command.patterns]
+        command.is_async = asyncio.iscoroutinefunction(command.handler)
+        previous = self.commands.get(command.name)
+        if previous is not None:
+            self._category_index[previous.category].remove(previous)
         self.commands[command.name] = command
-        self.logger.debug(f"Registered command: {command.name}")
+        self._category_index.setdefault(command.category, []).append(command)
+        self._help_text = None
+        self.logger.debug("Registered command: %s", command.name)
     
     def _load_custom_commands(self):
         """Load custom commands from configuration"""
@@ -264,71 +443,137 @@ class CommandProcessor:
                 )
                 self._register_command(command)
             except Exception as e:
-                self.logger.error(f"Failed to load custom command '{cmd_name}': {e}")
+                self.logger.error("Failed to load custom command '%s': %s", cmd_name, e)
     
+    # Source templates for generated custom-command handlers. exec'ing a
+    # flat specialized function per command avoids the closure-cell lookups
+    # a nested def pays on every dispatch; the action payload is baked in
+    # as a default argument.
+    _HANDLER_TEMPLATES = {
+        'keystroke': (
+            "async def _h(km, _d={data!r}):\n"
+            "    await km.send_key_combination(_d)\n"
+        ),
+        'type': (
+            "async def _h(km, _d={data!r}):\n"
+            "    await km.type_text(_d)\n"
+        ),
+    }
+
     def _create_custom_handler(self, cmd_data):
         """Create handler for custom command"""
         action_type = cmd_data.get('type', 'keystroke')
         action_data = cmd_data.get('action', '')
-        
-        if action_type == 'keystroke':
-            async def handler():
-                await self.keystroke_manager.send_key_combination(action_data)
-            return handler
-        elif action_type == 'type':
-            async def handler():
-                await self.keystroke_manager.type_text(action_data)
-            return handler
-        elif action_type == 'command':
-            def handler():
-                return subprocess.run(action_data, shell=True)
-            return handler
-        else:
-            def handler():
-                self.logger.warning(f"Unknown command type: {action_type}")
+
+        template = self._HANDLER_TEMPLATES.get(action_type)
+        if template is not None:
+            namespace = {}
+            exec(compile(template.format(data=action_data), '<custom-command>', 'exec'), namespace)
+            return functools.partial(namespace['_h'], self.keystroke_manager)
+        if action_type == 'command':
+            # Split the command line once at registration and pass argv
+            # directly: no shell process per invocation, and no shell=True
+            # injection surface
+            argv = shlex.split(action_data)
+
+            async def handler(_argv=argv):
+                await asyncio.create_subprocess_exec(
+                    *_argv,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL)
             return handler
+
+        def handler():
+            self.logger.warning("Unknown command type: %s", action_type)
+        return handler
     
+    async def start(self):
+        """Start the worker task that drains the command queue"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._consume())
+
+    async def enqueue(self, text: str):
+        """Hand one recognized utterance to the dispatch worker
+
+        put_nowait keeps the recognizer loop non-blocking; if dispatch ever
+        falls a full queue behind, the newest utterance is dropped with a
+        warning instead of stalling audio consumption.
+        """
+        if self._worker is None:
+            await self.start()
+        try:
+            self._cmd_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            self.logger.warning("Command queue full, dropping: '%s'", text)
+
+    async def _consume(self):
+        """Worker loop: dispatch queued utterances one at a time"""
+        while True:
+            text = await self._cmd_queue.get()
+            try:
+                await self.process_command(text)
+            except Exception as e:
+                self.logger.error("Error processing queued command '%s': %s", text, e)
+            finally:
+                self._cmd_queue.task_done()
+
     async def process_command(self, text: str):
         """Process a voice command"""
-        text = text.strip().lower()
-        
-        if not text:
+        # Whisper yields empty/whitespace segments for every pause; bail
+        # out before paying any per-utterance allocation for them
+        if not text or text.isspace():
             return
-            
-        self.logger.info(f"Processing: {text}")
+
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        # No .lower() copy here: every matcher downstream is
+        # case-insensitive, and dictation can then keep Whisper's casing
+        text = text.strip()
+
+        self.logger.info("Processing: %s", text)
         
         # Check if in dictation mode
         if self.dictation_mode:
-            self.logger.info(f"Dictation mode: Processing '{text}'")
+            self.logger.info("Dictation mode: Processing '%s'", text)
             
             # Check for stop dictation commands
-            if any(stop_word in text for stop_word in self.stop_dictation_words):
+            if self._stop_dictation_re is not None and self._stop_dictation_re.search(text):
+                await self._drain_dictation()
                 await self._stop_dictation()
                 return
-            
+
+            # One case fold for the whole dictation hot path; text is
+            # already stripped above
+            text_lower = text.lower()
+
             # Check for "press key" commands during dictation
-            key_command_executed = await self._check_press_key_commands(text)
+            key_command_executed = await self._press_key_from_normalized(text_lower)
             if key_command_executed:
-                self.logger.info(f"Key command executed successfully for: '{text}'")
+                self.logger.info("Key command executed successfully for: '%s'", text)
                 return
-            
+
             # Check for custom commands during dictation
-            custom_command_executed = await self._check_custom_commands_in_dictation(text)
+            custom_command_executed = await self._custom_dictation_from_normalized(text_lower)
             if custom_command_executed:
-                self.logger.info(f"Custom command executed successfully for: '{text}'")
+                self.logger.info("Custom command executed successfully for: '%s'", text)
                 return
-            
-            # Otherwise, type the text
-            self.logger.info(f"Typing as dictation text: '{text}'")
-            await self.keystroke_manager.type_text(text + " ")
+
+            # Otherwise buffer the text; the coalescer window joins any
+            # burst of segments into a single type_text batch
+            self.logger.info("Typing as dictation text: '%s'", text)
+            self._dictation_buf.append(text)
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_dictation_later())
             return
-          # Check for wake word activation
-        if not self._has_wake_word(text):
-            self.logger.debug(f"No wake word found in: '{text}' - ignoring")
+          # Wake-word gate and removal fused into one regex pass
+        command_text = self._strip_wake_words(text)
+        if command_text is None:
+            self.logger.debug("No wake word found in: '%s' - ignoring", text)
             return
-              # Remove wake words from text
-        command_text = self._remove_wake_words(text)
-        self.logger.debug(f"After removing wake words: '{command_text}'")
+        self.logger.debug("After removing wake words: '%s'", command_text)
         
         # Try to match and execute command
         command_executed = await self._execute_command(command_text)
@@ -336,79 +581,229 @@ class CommandProcessor:
         # If no command was executed and we're not in dictation mode, 
         # do NOT type the remaining text as that causes the duplication issue
         if not command_executed:
-            self.logger.debug(f"No command matched for '{command_text}' - not typing as text")
+            self.logger.debug("No command matched for '%s' - not typing as text", command_text)
     
+    async def _type_buffered(self):
+        """Emit the coalesced dictation buffer as one batched type_text call"""
+        if not self._dictation_buf:
+            return
+        batch = " ".join(self._dictation_buf) + " "
+        self._dictation_buf.clear()
+        # delay=0 takes the single-call fast path in the keystroke manager
+        await self.keystroke_manager.type_text(batch, delay=0)
+
+    async def _flush_dictation_later(self):
+        """Coalescer: give back-to-back segments a short window to merge"""
+        await asyncio.sleep(self._DICTATION_FLUSH_DELAY)
+        self._flush_task = None
+        await self._type_buffered()
+
+    async def _drain_dictation(self):
+        """Flush buffered dictation text immediately, cancelling the timer"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        await self._type_buffered()
+
+    def _strip_wake_words(self, text: str) -> Optional[str]:
+        """Remove wake words in one pass, or return None when none occur
+
+        subn reports the match count alongside the substitution, so the
+        presence check and the removal share a single traversal.
+        """
+        if self._wake_re is None:
+            return None
+        stripped, n = self._wake_re.subn(" ", text)
+        if n == 0:
+            return None
+        return " ".join(stripped.split())
+
     def _has_wake_word(self, text: str) -> bool:
         """Check if text contains a wake word"""
-        text_words = text.split()
-        for wake_word in self.wake_words:
-            wake_word_parts = wake_word.split()
-            # Check if all parts of the wake word are present in sequence
-            for i in range(len(text_words) - len(wake_word_parts) + 1):
-                if text_words[i:i+len(wake_word_parts)] == wake_word_parts:
-                    self.logger.debug(f"Found wake word '{wake_word}' in text")
-                    return True
-        return False
-    
+        return self._wake_re is not None and self._wake_re.search(text) is not None
+
     def _remove_wake_words(self, text: str) -> str:
         """Remove wake words from text"""
-        text_words = text.split()
-        for wake_word in self.wake_words:
-            wake_word_parts = wake_word.split()
-            # Find and remove wake word sequence
-            for i in range(len(text_words) - len(wake_word_parts) + 1):
-                if text_words[i:i+len(wake_word_parts)] == wake_word_parts:
-                    # Remove the wake word parts
-                    text_words = text_words[:i] + text_words[i+len(wake_word_parts):]
-                    break
-        return " ".join(text_words).strip()
+        if self._wake_re is None:
+            return text.strip()
+        # Substitute with a space, then rejoin to normalize the gaps the
+        # removed phrases leave behind
+        return " ".join(self._wake_re.sub(" ", text).split())
     
-    async def _execute_command(self, text: str):
-        """Execute a matched command"""
-        command_executed = False
-        
+    def _build_dispatch_index(self):
+        """Build the literal/regex dispatch index over registered commands
+
+        Literal phrases go into an Aho-Corasick automaton when pyahocorasick
+        is available, so one pass over the utterance finds every literal hit
+        no matter how many commands are registered. Regex patterns stay in a
+        flat list that is only walked when no literal matched.
+        """
+        self._literal_entries: List[Tuple[Command, str]] = []
+        self._regex_entries: List[Tuple[Command, Any]] = []
+
+        for command in self.commands.values():
+            for compiled, is_regex, literal in command.matchers:
+                if is_regex:
+                    self._regex_entries.append((command, compiled))
+                else:
+                    self._literal_entries.append((command, literal))
+
+        # Specificity first: longer phrases are tried before their
+        # substrings, so 'maximize window' can never lose to 'maximize'
+        # in the linear fallback scan. The automaton path gets the same
+        # behavior from its longest-hit selection in _match_literal.
+        self._literal_entries.sort(key=lambda entry: len(entry[1]), reverse=True)
+
+        # Exact-phrase hash lookup resolves one-word utterances like
+        # 'copy' or 'paste' in O(1) before any substring machinery runs
+        self._literal_exact: Dict[str, Tuple[Command, str]] = {}
+        for command, literal in self._literal_entries:
+            self._literal_exact.setdefault(literal, (command, literal))
+
+        # Custom/dictation commands are also checked on every dictated
+        # utterance; index their patterns here, lowercased once, so that
+        # path never walks the full registry
+        self._dictation_literal_index: Dict[str, Tuple[Command, str]] = {}
+        self._dictation_substrings: List[Tuple[str, str, Command]] = []
         for command in self.commands.values():
+            if command.category not in ('custom', 'dictation'):
+                continue
             for pattern in command.patterns:
-                # Try regex match first
-                if '(' in pattern:  # Regex pattern
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        try:
-                            self.logger.debug(f"Regex match found for pattern '{pattern}' in command '{command.name}'")
-                            if asyncio.iscoroutinefunction(command.handler):
-                                await command.handler(*match.groups())
-                            else:
-                                await asyncio.get_event_loop().run_in_executor(
-                                    None, command.handler, *match.groups()
-                                )
-                            self.logger.info(f"Successfully executed command: {command.name} with args: {match.groups()}")
-                            command_executed = True
-                            return True  # Return True to indicate command was executed
-                        except Exception as e:
-                            self.logger.error(f"Error executing command '{command.name}': {e}")
-                            return False
-                
-                # Try exact match
-                elif pattern in text:
-                    try:
-                        self.logger.debug(f"Exact match found for pattern '{pattern}' in command '{command.name}'")
-                        if asyncio.iscoroutinefunction(command.handler):
-                            await command.handler()
-                        else:
-                            await asyncio.get_event_loop().run_in_executor(
-                                None, command.handler
-                            )
-                        self.logger.info(f"Successfully executed command: {command.name}")
-                        command_executed = True
-                        return True  # Return True to indicate command was executed
-                    except Exception as e:
-                        self.logger.error(f"Error executing command '{command.name}': {e}")
-                        return False
-        
-        if not command_executed:
-            self.logger.debug(f"No command found for: '{text}'")
+                pattern_lower = pattern.lower()
+                self._dictation_literal_index.setdefault(pattern_lower, (command, pattern))
+                self._dictation_substrings.append((pattern_lower, pattern, command))
+
+        # Compose every regex pattern into one alternation so the regex
+        # phase is a single engine invocation instead of a Python loop of
+        # N searches. Each alternative gets a named wrapper group; its
+        # inner capture groups are located by precomputed offset.
+        self._regex_master = None
+        self._regex_groups: Dict[str, Tuple[Command, int, int]] = {}
+        if self._regex_entries:
+            parts = []
+            group_number = 1
+            for i, (command, compiled) in enumerate(self._regex_entries):
+                name = f"cmd{i}"
+                parts.append(f"(?P<{name}>{compiled.pattern})")
+                self._regex_groups[name] = (command, group_number + 1, compiled.groups)
+                group_number += 1 + compiled.groups
+            try:
+                self._regex_master = re.compile("|".join(parts), re.IGNORECASE)
+            except re.error:
+                # A pattern that does not compose (e.g. clashing group
+                # names) drops us back to the per-pattern loop
+                self._regex_master = None
+                self._regex_groups = {}
+
+        self._automaton = None
+        if ahocorasick is not None and self._literal_entries:
+            automaton = ahocorasick.Automaton()
+            for command, literal in self._literal_entries:
+                # First registration wins for duplicate literals, matching
+                # the insertion-order semantics of the linear scan
+                if not automaton.exists(literal):
+                    automaton.add_word(literal, (command, literal))
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def _match_literal(self, text: str) -> Optional[Tuple[Command, str]]:
+        """Find a literal command hit in the utterance, preferring the
+        longest (most specific) phrase when several literals match"""
+        exact = self._literal_exact.get(text)
+        if exact is not None:
+            return exact
+
+        if self._automaton is not None:
+            best = None
+            for _end, (command, literal) in self._automaton.iter(text):
+                if best is None or len(literal) > len(best[1]):
+                    best = (command, literal)
+            return best
+
+        for command, literal in self._literal_entries:
+            if literal in text:
+                return (command, literal)
+        return None
+
+    async def _execute_command(self, text: str):
+        """Execute a matched command"""
+        # Literal phase: one multi-pattern pass over the utterance. Case is
+        # folded only for this prefilter (the automaton stores lowercase
+        # keywords); regex patterns are IGNORECASE-compiled and see the
+        # original text so captured groups keep their casing.
+        hit = self._match_literal(text.lower())
+        if hit is not None:
+            command, literal = hit
+            self.logger.debug("Exact match found for pattern '%s' in command '%s'", literal, command.name)
+            if command.blocking:
+                return await self._run_handler(command)
+            self._spawn_handler(command)
+            return True  # Return True to indicate command was executed
+
+        # Regex phase: only reached when no literal phrase matched
+        if self._regex_master is not None:
+            match = self._regex_master.search(text)
+            if match:
+                command, first_group, n_groups = self._regex_groups[match.lastgroup]
+                args = match.groups()[first_group - 1:first_group - 1 + n_groups]
+                self.logger.debug("Regex match found in command '%s'", command.name)
+                if command.blocking:
+                    return await self._run_handler(command, args)
+                self._spawn_handler(command, args)
+                return True  # Return True to indicate command was executed
+        else:
+            for command, compiled in self._regex_entries:
+                match = compiled.search(text)
+                if match:
+                    self.logger.debug("Regex match found for pattern '%s' in command '%s'", compiled.pattern, command.name)
+                    if command.blocking:
+                        return await self._run_handler(command, match.groups())
+                    self._spawn_handler(command, match.groups())
+                    return True  # Return True to indicate command was executed
+
+        self.logger.debug("No command found for: '%s'", text)
         return False  # Return False to indicate no command was executed
-    
+
+    async def _run_handler(self, command: Command, args: Tuple = ()) -> bool:
+        """Run one handler with the dispatch strategy chosen at registration
+
+        Shared by the inline (blocking) path and background tasks, so
+        success and failure are logged the same way in both cases.
+        """
+        try:
+            if command.is_async:
+                await command.handler(*args)
+            elif command.fast_sync:
+                # Keystroke lambdas just enqueue key events; calling them
+                # inline is cheaper than an executor hop. If the lambda
+                # wraps a coroutine (keystroke_manager methods are async),
+                # await it here instead of losing it in a worker thread.
+                result = command.handler(*args)
+                if asyncio.iscoroutine(result):
+                    await result
+            else:
+                await self._loop.run_in_executor(self._executor, command.handler, *args)
+            if args:
+                self.logger.info("Successfully executed command: %s with args: %s", command.name, args)
+            else:
+                self.logger.info("Successfully executed command: %s", command.name)
+            return True
+        except Exception as e:
+            self.logger.error("Error executing command '%s': %s", command.name, e)
+            return False
+
+    def _spawn_handler(self, command: Command, args: Tuple = ()):
+        """Fire-and-forget execution for handlers the user never waits on
+
+        Browser and application launches can take hundreds of milliseconds;
+        running them as background tasks keeps the recognizer free to
+        consume the next utterance. The task set holds strong references
+        until each task's done-callback removes it.
+        """
+        task = asyncio.create_task(self._run_handler(command, args))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
     # Command handlers
     async def _start_dictation(self):
         """Start dictation mode"""
@@ -423,35 +818,29 @@ class CommandProcessor:
     async def _open_application(self, app_name: str):
         """Open an application"""
         try:
-            system = platform.system().lower()
-            
-            if system == "linux":
-                # Try common application names
-                subprocess.Popen([app_name])
-            elif system == "windows":
-                subprocess.Popen([app_name])
-            elif system == "darwin":  # macOS
-                subprocess.Popen(["open", "-a", app_name])
-                
-            self.logger.info(f"Opened application: {app_name}")
+            # Fire-and-forget: the event loop reaps the child, no thread
+            # blocks on fork/exec and nobody needs the exit status
+            await asyncio.create_subprocess_exec(
+                *_open_app_argv(app_name),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+
+            self.logger.info("Opened application: %s", app_name)
         except Exception as e:
-            self.logger.error(f"Failed to open application '{app_name}': {e}")
+            self.logger.error("Failed to open application '%s': %s", app_name, e)
     
     async def _close_application(self, app_name: str):
         """Close an application"""
         try:
-            system = platform.system().lower()
-            
-            if system == "linux":
-                subprocess.run(["pkill", "-f", app_name])
-            elif system == "windows":
-                subprocess.run(["taskkill", "/f", "/im", f"{app_name}.exe"])
-            elif system == "darwin":  # macOS
-                subprocess.run(["pkill", "-f", app_name])
+            proc = await asyncio.create_subprocess_exec(
+                *_close_app_argv(app_name),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL)
+            await proc.wait()
                 
-            self.logger.info(f"Closed application: {app_name}")
+            self.logger.info("Closed application: %s", app_name)
         except Exception as e:
-            self.logger.error(f"Failed to close application '{app_name}': {e}")
+            self.logger.error("Failed to close application '%s': %s", app_name, e)
     
     async def _open_website(self, url: str):
         """Open a website in the default browser"""
@@ -461,77 +850,74 @@ class CommandProcessor:
                 if '.' in url:
                     url = f"https://{url}"
                 else:
-                    url = f"https://www.google.com/search?q={url}"
+                    url = "https://www.google.com/search?" + urlencode({"q": url})
             
-            webbrowser.open(url)
-            self.logger.info(f"Opened website: {url}")
+            _get_webbrowser().open(url)
+            self.logger.info("Opened website: %s", url)
         except Exception as e:
-            self.logger.error(f"Failed to open website '{url}': {e}")
+            self.logger.error("Failed to open website '%s': %s", url, e)
     
     async def _search_web(self, query: str):
         """Search the web"""
         try:
-            search_url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-            webbrowser.open(search_url)
-            self.logger.info(f"Searched for: {query}")
+            # urlencode is one C-level pass and, unlike the old
+            # replace(' ', '+'), survives &, # and ? in spoken queries
+            search_url = "https://www.google.com/search?" + urlencode({"q": query})
+            _get_webbrowser().open(search_url)
+            self.logger.info("Searched for: %s", query)
         except Exception as e:
-            self.logger.error(f"Failed to search for '{query}': {e}")
+            self.logger.error("Failed to search for '%s': %s", query, e)
     
     async def _switch_window(self, window_name: str):
         """Switch to a specific window"""
         success = await self.keystroke_manager.focus_window(window_name)
         if success:
-            self.logger.info(f"Switched to window: {window_name}")
+            self.logger.info("Switched to window: %s", window_name)
         else:
-            self.logger.warning(f"Could not find window: {window_name}")
+            self.logger.warning("Could not find window: %s", window_name)
     
     async def _minimize_window(self):
         """Minimize current window"""
-        system = platform.system().lower()
-        if system == "windows":
-            await self.keystroke_manager.send_key_combination("win+down")
-        else:
-            await self.keystroke_manager.send_key_combination("ctrl+alt+9")
-    
+        await self.keystroke_manager.send_key_combination(_MINIMIZE_COMBO)
+
     async def _maximize_window(self):
         """Maximize current window"""
-        system = platform.system().lower()
-        if system == "windows":
-            await self.keystroke_manager.send_key_combination("win+up")
-        else:
-            await self.keystroke_manager.send_key_combination("ctrl+alt+0")
+        await self.keystroke_manager.send_key_combination(_MAXIMIZE_COMBO)
     
     async def _lock_screen(self):
         """Lock the screen"""
-        system = platform.system().lower()
         try:
-            if system == "linux":
-                subprocess.run(["gnome-screensaver-command", "-l"])
-            elif system == "windows":
-                await self.keystroke_manager.send_key_combination("win+l")
-            elif system == "darwin":  # macOS
-                subprocess.run(["/System/Library/CoreServices/Menu Extras/User.menu/Contents/Resources/CGSession", "-suspend"])
+            await self._lock_screen_impl()
         except Exception as e:
-            self.logger.error(f"Failed to lock screen: {e}")
+            self.logger.error("Failed to lock screen: %s", e)
+
+    async def _lock_screen_linux(self):
+        await asyncio.create_subprocess_exec(
+            "gnome-screensaver-command", "-l",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL)
+
+    async def _lock_screen_windows(self):
+        await self.keystroke_manager.send_key_combination("win+l")
+
+    async def _lock_screen_darwin(self):
+        await asyncio.create_subprocess_exec(
+            "/System/Library/CoreServices/Menu Extras/User.menu/Contents/Resources/CGSession", "-suspend",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL)
     
     async def _show_help(self):
         """Show available commands"""
-        help_text = "Available commands:\n\n"
-        
-        categories = {}
-        for command in self.commands.values():
-            if command.category not in categories:
-                categories[command.category] = []
-            categories[command.category].append(command)
-        
-        for category, cmds in categories.items():
-            help_text += f"{category.upper()}:\n"
-            for cmd in cmds:
-                help_text += f"  - {cmd.description}\n"
-            help_text += "\n"
-        
+        if self._help_text is None:
+            parts = ["Available commands:\n"]
+            for category, cmds in self._category_index.items():
+                parts.append(f"{category.upper()}:")
+                parts.extend(f"  - {cmd.description}" for cmd in cmds)
+                parts.append("")
+            self._help_text = "\n".join(parts)
+
         self.logger.info("Help requested")
-        print(help_text)
+        print(self._help_text)
     
     async def _show_status(self):
         """Show current status"""
@@ -545,22 +931,21 @@ class CommandProcessor:
         self.logger.info("Status requested")
         print(status)
     
-    def get_commands_by_category(self) -> Dict[str, List[Command]]:
-        """Get commands organized by category"""
-        categories = {}
-        for command in self.commands.values():
-            if command.category not in categories:
-                categories[command.category] = []
-            categories[command.category].append(command)
-        return categories
+    def get_commands_by_category(self) -> Mapping[str, List[Command]]:
+        """Get commands organized by category
+
+        Returns a read-only live view of the maintained index rather than
+        copying the dict and every per-category list on each call.
+        """
+        return types.MappingProxyType(self._category_index)
     
     async def _type_text(self, text: str):
         """Type the specified text"""
         try:
             await self.keystroke_manager.type_text(text)
-            self.logger.info(f"Typed text: {text}")
+            self.logger.info("Typed text: %s", text)
         except Exception as e:
-            self.logger.error(f"Failed to type text '{text}': {e}")
+            self.logger.error("Failed to type text '%s': %s", text, e)
     
     async def _press_key(self, key: str):
         """Press the specified key or key combination"""
@@ -580,89 +965,86 @@ class CommandProcessor:
                 # Single key
                 await self.keystroke_manager.send_key(key)
             
-            self.logger.info(f"Pressed key: {key}")
+            self.logger.info("Pressed key: %s", key)
         except Exception as e:
-            self.logger.error(f"Failed to press key '{key}': {e}")
+            self.logger.error("Failed to press key '%s': %s", key, e)
     
     async def _check_press_key_commands(self, text: str) -> bool:
         """
         Check if the text contains a "press key" command during dictation mode.
         Returns True if a key command was executed, False otherwise.
         """
-        text_lower = text.lower().strip()
-        
-        # Define more specific patterns for "press key" commands to avoid false positives
-        # These patterns handle punctuation and are more flexible
-        press_key_patterns = [
-            r"press key (.+?)\.?$",        # "press key enter" or "press key enter."
-            r"press (.+?) key\.?$",        # "press enter key" or "press enter key."
-            r"hit key (.+?)\.?$",          # "hit key backspace" or "hit key backspace."
-            r"hit (.+?) key\.?$",          # "hit escape key" or "hit escape key."
-            r"^key (.+?)\.?$",             # "key tab" or "key tab."
-            r"^press (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|page up|page down|f\d+)\.?$",  # Direct key commands
-            r"^hit (enter|tab|space|escape|backspace|delete|home|end|up|down|left|right|page up|page down|f\d+)\.?$",    # "hit enter", "hit tab", etc.
-            r"press (ctrl|shift|alt) (.+?)\.?$",  # "press ctrl c", "press shift tab", etc.
-            r"hit (ctrl|shift|alt) (.+?)\.?$",    # "hit ctrl c", "hit shift tab", etc.
-        ]
-        
-        for pattern in press_key_patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                # Handle different pattern groups
-                if "ctrl" in pattern or "shift" in pattern or "alt" in pattern:
-                    # For modifier patterns like "press ctrl c"
-                    if match.lastindex == 2:
+        return await self._press_key_from_normalized(text.lower().strip())
+
+    async def _press_key_from_normalized(self, text_lower: str) -> bool:
+        """Press-key matching for text already lowercased and stripped"""
+        # Fast path: the common "press enter"/"hit tab" forms resolve with
+        # one dict lookup, retiring zero regex work
+        key_name = _DIRECT_KEY_PHRASES.get(text_lower.rstrip('.'))
+
+        if key_name is None:
+            for compiled, is_modifier in _PRESS_KEY_PATTERNS:
+                match = compiled.search(text_lower)
+                if match:
+                    if is_modifier and match.lastindex == 2:
+                        # Modifier forms like "press ctrl c" combine both groups
                         modifier = match.group(1).strip()
                         key = match.group(2).strip().rstrip('.')
                         key_name = f"{modifier} {key}"
                     else:
                         key_name = match.group(1).strip().rstrip('.')
-                else:
-                    # For regular patterns
-                    key_name = match.group(1).strip().rstrip('.')
-                
-                self.logger.info(f"Detected press key command during dictation: '{key_name}'")
-                
-                try:
-                    # Execute the key press
-                    await self._press_key(key_name)
-                    return True
-                except Exception as e:
-                    self.logger.error(f"Error executing press key command '{key_name}': {e}")
-                    return False
-        
-        return False
+                    break
+
+        if key_name is None:
+            return False
+
+        self.logger.info("Detected press key command during dictation: '%s'", key_name)
+
+        try:
+            # Keystrokes must not overtake buffered text: flush whatever
+            # the coalescer is still holding before the key fires
+            await self._drain_dictation()
+            # Execute the key press
+            await self._press_key(key_name)
+            return True
+        except Exception as e:
+            self.logger.error("Error executing press key command '%s': %s", key_name, e)
+            return False
     
     async def _check_custom_commands_in_dictation(self, text: str) -> bool:
         """Check if the text matches any custom commands during dictation mode"""
-        text_lower = text.lower().strip()
-        
-        # Iterate through all registered commands to find custom ones
-        for command_name, command in self.commands.items():
-            # Only check custom commands or commands with 'dictation' category
-            if command.category not in ['custom', 'dictation']:
-                continue
-                
-            # Check if any pattern matches
-            for pattern in command.patterns:
-                pattern_lower = pattern.lower()
-                
-                # Check for exact match or if the pattern is contained in the text
-                if pattern_lower == text_lower or pattern_lower in text_lower:
-                    self.logger.info(f"Custom command matched during dictation: '{pattern}' -> '{command.description}'")
-                    
-                    try:
-                        # Execute the custom command
-                        if asyncio.iscoroutinefunction(command.handler):
-                            await command.handler()
-                        else:
-                            result = command.handler()
-                            if asyncio.iscoroutine(result):
-                                await result
-                        
-                        return True
-                    except Exception as e:
-                        self.logger.error(f"Error executing custom command '{pattern}': {e}")
-                        return False
-        
-        return False
\ No newline at end of file
+        return await self._custom_dictation_from_normalized(text.lower().strip())
+
+    async def _custom_dictation_from_normalized(self, text_lower: str) -> bool:
+        """Custom-command matching for text already lowercased and stripped"""
+        # Exact phrase first (one hash lookup), then the substring list -
+        # both prebuilt over just the custom/dictation commands, with the
+        # patterns already lowercased
+        hit = self._dictation_literal_index.get(text_lower)
+        if hit is None:
+            for pattern_lower, pattern, command in self._dictation_substrings:
+                if pattern_lower in text_lower:
+                    hit = (command, pattern)
+                    break
+        if hit is None:
+            return False
+
+        command, pattern = hit
+        self.logger.info("Custom command matched during dictation: '%s' -> '%s'", pattern, command.description)
+
+        try:
+            # Keystrokes must not overtake buffered text: flush whatever
+            # the coalescer is still holding before the command fires
+            await self._drain_dictation()
+            # Execute the custom command
+            if command.is_async:
+                await command.handler()
+            else:
+                result = command.handler()
+                if asyncio.iscoroutine(result):
+                    await result
+
+            return True
+        except Exception as e:
+            self.logger.error("Error executing custom command '%s': %s", pattern, e)
+            return False
\ No newline at end of file
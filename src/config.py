@@ -6,6 +6,14 @@ Handles loading and validation of configuration settings
 import logging
 import yaml
 from pathlib import Path
+
+# Prefer libyaml's C-backed loader/dumper when PyYAML was built with it:
+# parsing is roughly an order of magnitude faster than the pure-Python
+# implementation, which matters for startup time. Falls back transparently.
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
 from typing import Any, Dict, Optional
 
 class Config:
@@ -13,16 +21,18 @@ class Config:
         self.logger = logging.getLogger(__name__)
         self.config_path = Path(config_path)
         self.config_data = {}
-        
+        self._flat: Dict[str, Any] = {}
+
         self._load_config()
         self._validate_config()
+        self._rebuild_flat()
     
     def _load_config(self):
         """Load configuration from file"""
         try:
             if self.config_path.exists():
                 with open(self.config_path, 'r') as f:
-                    self.config_data = yaml.safe_load(f) or {}
+                    self.config_data = yaml.load(f, Loader=_YamlLoader) or {}
                 self.logger.info(f"Loaded configuration from {self.config_path}")
             else:
                 self.logger.warning(f"Configuration file {self.config_path} not found, using defaults")
@@ -56,7 +66,7 @@ class Config:
         
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(default_config, f, default_flow_style=False)
+                yaml.dump(default_config, f, Dumper=_YamlDumper, default_flow_style=False)
             self.config_data = default_config
             self.logger.info(f"Created default configuration at {self.config_path}")
         except Exception as e:
@@ -77,21 +87,30 @@ class Config:
             self.logger.warning(f"Invalid model size '{whisper.get('model_size')}', using 'base'")
             self.config_data.setdefault('whisper', {})['model_size'] = 'base'
     
+    def _rebuild_flat(self):
+        """Flatten config_data into a dotted-key map
+
+        get() is called repeatedly with the same keys (component __init__,
+        per-command lookups), so resolving each one to a single dict probe
+        beats splitting the key and walking nested dicts every call.
+        Intermediate dicts are kept at their own paths so get('audio')
+        still returns the whole section.
+        """
+        flat: Dict[str, Any] = {}
+
+        def _walk(node: Dict[str, Any], prefix: str):
+            for k, v in node.items():
+                path = prefix + k
+                flat[path] = v
+                if isinstance(v, dict):
+                    _walk(v, path + '.')
+
+        _walk(self.config_data, '')
+        self._flat = flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation"""
-        try:
-            keys = key.split('.')
-            value = self.config_data
-            
-            for k in keys:
-                if isinstance(value, dict) and k in value:
-                    value = value[k]
-                else:
-                    return default
-            
-            return value
-        except Exception:
-            return default
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
@@ -105,6 +124,7 @@ class Config:
                 config = config[k]
             
             config[keys[-1]] = value
+            self._rebuild_flat()
             self._save_config()
         except Exception as e:
             self.logger.error(f"Failed to set configuration {key}: {e}")
@@ -113,11 +133,12 @@ class Config:
         """Save configuration to file"""
         try:
             with open(self.config_path, 'w') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False)
+                yaml.dump(self.config_data, f, Dumper=_YamlDumper, default_flow_style=False)
         except Exception as e:
             self.logger.error(f"Failed to save configuration: {e}")
     
     def reload(self):
         """Reload configuration from file"""
         self._load_config()
-        self._validate_config()
\ No newline at end of file
+        self._validate_config()
+        self._rebuild_flat()
\ No newline at end of file
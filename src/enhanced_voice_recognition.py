@@ -4,13 +4,13 @@ Supports standard Whisper, Faster-Whisper, and other high-accuracy models
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import math
+import os
 import numpy as np
 import pyaudio
 import wave
-import tempfile
-import threading
-from queue import Queue, Empty
 from typing import AsyncGenerator, Optional
 import torch
 
@@ -31,20 +31,57 @@ class EnhancedVoiceRecognizer:
         self.model_size = config.get('whisper.model_size', 'large-v3')
         self.language = config.get('whisper.language', None)  # Auto-detect if None
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        # Greedy decoding by default: voice-control utterances are short,
+        # and beam search multiplies decoder cost ~beam_size times for no
+        # measurable accuracy gain on them. Long-form dictation users can
+        # raise these in the config.
+        self.beam_size = config.get('whisper.beam_size', 1)
+        self.best_of = config.get('whisper.best_of', 1)
+        # Silero VAD inside faster-whisper strips silence from the captured
+        # window before the encoder sees it — fewer frames to decode and
+        # the standard mitigation for Whisper's silence hallucinations
+        self.vad_filter = config.get('whisper.vad_filter', True)
         
+        # Dedicated single-worker executor for transcription: the same
+        # pinned thread keeps per-thread CUDA/cuBLAS state hot between
+        # utterances and transcription never queues behind other users of
+        # the loop's default executor
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="asr")
+
         # Initialize the appropriate model
         self._initialize_model()
         
-        # Audio processing
+        # Audio processing. The capture callback hands chunks to the event
+        # loop through call_soon_threadsafe so the consumer awaits the
+        # queue instead of polling it; both are bound lazily in
+        # recognize_once, once a running loop exists.
         self.audio = pyaudio.PyAudio()
-        self.audio_queue = Queue()
+        # Cache the C-extension lookups PyAudio would otherwise repeat:
+        # the sample width is fixed by self.format, and the device list
+        # only changes when the device count does
+        self._sample_width = self.audio.get_sample_size(self.format)
+        self._device_cache = None
+        self.audio_queue: Optional[asyncio.Queue] = None
+        self._loop = None
         self.is_recording = False
         
         # Enhanced VAD settings
         self.silence_threshold = config.get('audio.silence_threshold', 500)
+        # Comparing mean-square energy against the squared threshold gives
+        # the same decision as RMS > threshold without a sqrt per chunk
+        self._silence_sq = float(self.silence_threshold) ** 2
         self.silence_duration = config.get('audio.silence_duration', 2.0)
         self.min_audio_length = config.get('audio.min_audio_length', 1.0)
         self.vad_padding_ms = config.get('audio.vad_padding_ms', 300)
+
+        # Preallocated utterance buffer: captured chunks are copied into
+        # this int16 array as they arrive instead of accumulating bytes
+        # objects and joining them, so the per-utterance allocation churn
+        # is a single astype() at hand-off
+        self.max_utterance_s = config.get('audio.max_utterance_length', 30)
+        self._audio_buf = np.empty(self.sample_rate * self.max_utterance_s, dtype=np.int16)
+        self._audio_len = 0
         
         # Log configuration
         self.logger.info(f"Initialized {self.model_type} with model '{self.model_size}' on {self.device}")
@@ -62,18 +99,46 @@ class EnhancedVoiceRecognizer:
         if self.model_type == 'faster-whisper':
             try:
                 from faster_whisper import WhisperModel
-                
+
                 # Determine device for faster-whisper
                 device = "cuda" if torch.cuda.is_available() else "cpu"
-                compute_type = "float16" if device == "cuda" else "float32"
-                
-                self.model = WhisperModel(
-                    self.model_size,
-                    device=device,
-                    compute_type=compute_type,
-                    download_root=None,
-                    local_files_only=False
+                # Quantized compute types roughly halve memory use and speed
+                # up decoding with negligible accuracy loss; any value
+                # CTranslate2 accepts can be set via whisper.compute_type
+                compute_type = self.config.get(
+                    'whisper.compute_type',
+                    'int8_float16' if device == 'cuda' else 'int8'
                 )
+
+                model_kwargs = {}
+                if device == 'cpu':
+                    # One worker using all cores: utterances are transcribed
+                    # one at a time, so intra-op threading is what scales
+                    model_kwargs['cpu_threads'] = os.cpu_count() or 1
+                    model_kwargs['num_workers'] = 1
+
+                try:
+                    self.model = WhisperModel(
+                        self.model_size,
+                        device=device,
+                        compute_type=compute_type,
+                        download_root=None,
+                        local_files_only=False,
+                        **model_kwargs
+                    )
+                except ValueError:
+                    # Quantized type unsupported by this device/build
+                    compute_type = "float16" if device == "cuda" else "float32"
+                    self.logger.warning(
+                        f"Requested compute type not supported, using {compute_type}")
+                    self.model = WhisperModel(
+                        self.model_size,
+                        device=device,
+                        compute_type=compute_type,
+                        download_root=None,
+                        local_files_only=False,
+                        **model_kwargs
+                    )
                 self.logger.info(f"✅ Faster-Whisper model loaded successfully (compute_type: {compute_type})")
                 
             except ImportError:
@@ -85,12 +150,51 @@ class EnhancedVoiceRecognizer:
             self._initialize_standard_whisper()
         else:
             raise ValueError(f"Unknown model type: {self.model_type}")
+
+        if self.device == 'cuda':
+            # Autotuned cuDNN kernels and TF32 matmul on Ampere+ GPUs;
+            # global flags, so setting them once at load time is enough
+            torch.backends.cudnn.benchmark = True
+            torch.set_float32_matmul_precision('high')
+
+        self._warm_up_model()
+
+    def _warm_up_model(self):
+        """Run a dummy transcription in the background
+
+        The first transcribe call pays kernel compilation, cuDNN autotune
+        and cache warming; feeding a second of silence through the model at
+        load time moves that cost off the first real utterance. Runs on the
+        transcription executor so startup isn't blocked and the pinned
+        worker thread is the one that gets warmed.
+        """
+        def warm_up():
+            try:
+                silence = np.zeros(self.sample_rate, dtype=np.float32)
+                if self.model_type == 'faster-whisper':
+                    segments, _ = self.model.transcribe(silence, beam_size=1, best_of=1)
+                    for _ in segments:  # generator; must be consumed to run
+                        pass
+                else:
+                    self.model.transcribe(silence, temperature=0.0, beam_size=1, best_of=1)
+                self.logger.info("Model warm-up complete")
+            except Exception as e:
+                self.logger.debug(f"Model warm-up skipped: {e}")
+
+        self._executor.submit(warm_up)
     
     def _initialize_standard_whisper(self):
         """Initialize standard OpenAI Whisper"""
         try:
             import whisper
             self.model = whisper.load_model(self.model_size, device=self.device)
+            if self.device == 'cuda':
+                # TF32 tensor-core matmul on Ampere+ costs <1 ULP accuracy;
+                # half precision is opt-out via whisper.fp16
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+                if self.config.get('whisper.fp16', True):
+                    self.model = self.model.half()
             self.logger.info("✅ Standard Whisper model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {e}")
@@ -99,6 +203,10 @@ class EnhancedVoiceRecognizer:
     async def recognize_once(self) -> Optional[str]:
         """Record and recognize a single audio segment"""
         try:
+            if self._loop is None:
+                self._loop = asyncio.get_running_loop()
+                self.audio_queue = asyncio.Queue()
+
             # Start recording
             stream = self.audio.open(
                 format=self.format,
@@ -118,20 +226,17 @@ class EnhancedVoiceRecognizer:
             
             if audio_data is None:
                 return None
-            
-            # Convert to audio file
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                self._save_audio_data(audio_data, temp_file.name)
-                
-                # Transcribe using the selected model
-                text = await self._transcribe_audio(temp_file.name)
-                
-                # Clean up
-                import os
-                os.unlink(temp_file.name)
-                
-                return text.strip() if text else None
-                
+
+            # Hand the samples to the model as an in-memory float32 array:
+            # both Whisper backends accept 16 kHz mono ndarrays directly,
+            # which skips the WAV encode, disk round trip, and ffmpeg decode
+            # the tempfile path paid on every utterance. astype copies out
+            # of the reused capture buffer.
+            audio_f32 = audio_data.astype(np.float32) / 32768.0
+
+            text = await self._transcribe_audio(audio_f32)
+            return text.strip() if text else None
+
         except Exception as e:
             self.logger.error(f"Recognition error: {e}")
             return None
@@ -141,33 +246,49 @@ class EnhancedVoiceRecognizer:
                 stream.stop_stream()
                 stream.close()
     
-    async def _transcribe_audio(self, file_path: str) -> str:
-        """Transcribe audio using the selected model"""
+    async def _transcribe_audio(self, audio: np.ndarray) -> str:
+        """Transcribe float32 PCM audio using the selected model"""
         try:
             if self.model_type == 'faster-whisper':
-                return await self._transcribe_faster_whisper(file_path)
+                return await self._transcribe_faster_whisper(audio)
             else:
-                return await self._transcribe_standard_whisper(file_path)
+                return await self._transcribe_standard_whisper(audio)
         except Exception as e:
             self.logger.error(f"Transcription error: {e}")
             return ""
     
-    async def _transcribe_faster_whisper(self, file_path: str) -> str:
+    async def _transcribe_faster_whisper(self, audio: np.ndarray) -> str:
         """Transcribe using Faster-Whisper"""
-        loop = asyncio.get_event_loop()
-        
+        loop = asyncio.get_running_loop()
+
         def transcribe():
-            segments, info = self.model.transcribe(
-                file_path,
+            options = dict(
                 language=self.language,
-                beam_size=5,
-                best_of=5,
+                beam_size=self.beam_size,
+                best_of=self.best_of,
                 temperature=0.0,
                 condition_on_previous_text=False,
                 initial_prompt=None,
-                word_timestamps=False
+                word_timestamps=False,
+                vad_filter=self.vad_filter,
+                vad_parameters={
+                    'min_silence_duration_ms': int(self.silence_duration * 1000),
+                    'speech_pad_ms': self.vad_padding_ms,
+                }
             )
-            
+
+            # Encoder cost scales with the mel window, and Whisper pads
+            # everything to 30 s by default — wasted frames for short
+            # commands. Hint the actual duration (floor 5 s) where
+            # faster-whisper supports chunk_length (>= 1.0).
+            duration = audio.size / self.sample_rate
+            chunk_length = min(30, max(5, math.ceil(duration)))
+            try:
+                segments, info = self.model.transcribe(
+                    audio, chunk_length=chunk_length, **options)
+            except TypeError:
+                segments, info = self.model.transcribe(audio, **options)
+
             # Extract text from segments
             text_segments = []
             for segment in segments:
@@ -175,94 +296,123 @@ class EnhancedVoiceRecognizer:
             
             return " ".join(text_segments).strip()
         
-        result = await loop.run_in_executor(None, transcribe)
+        result = await loop.run_in_executor(self._executor, transcribe)
         self.logger.debug(f"Faster-Whisper result: {result}")
         return result
     
-    async def _transcribe_standard_whisper(self, file_path: str) -> str:
+    async def _transcribe_standard_whisper(self, audio: np.ndarray) -> str:
         """Transcribe using standard Whisper"""
-        loop = asyncio.get_event_loop()
-        
+        loop = asyncio.get_running_loop()
+
         def transcribe():
             result = self.model.transcribe(
-                file_path,
+                audio,
                 language=self.language,
                 temperature=0.0,
-                best_of=5,
-                beam_size=5,
+                best_of=self.best_of,
+                beam_size=self.beam_size,
                 condition_on_previous_text=False,
                 initial_prompt=None,
                 word_timestamps=False
             )
             return result["text"]
         
-        result = await loop.run_in_executor(None, transcribe)
+        result = await loop.run_in_executor(self._executor, transcribe)
         self.logger.debug(f"Standard Whisper result: {result}")
         return result
     
     def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Audio callback function"""
-        if self.is_recording:
-            self.audio_queue.put(in_data)
+        """Audio callback function (runs on PyAudio's capture thread)"""
+        if self.is_recording and self._loop is not None:
+            self._loop.call_soon_threadsafe(self.audio_queue.put_nowait, in_data)
         return (None, pyaudio.paContinue)
     
+    def _append_audio(self, data) -> bool:
+        """Copy a captured chunk into the preallocated utterance buffer
+
+        Returns False when the buffer is full, which caps utterance length
+        at max_utterance_s.
+        """
+        samples = np.frombuffer(data, dtype=np.int16)
+        end = self._audio_len + samples.size
+        if end > self._audio_buf.size:
+            return False
+        self._audio_buf[self._audio_len:end] = samples
+        self._audio_len = end
+        return True
+
     async def _wait_for_speech(self):
-        """Wait for speech and return audio data"""
-        audio_frames = []
+        """Wait for speech and return the captured int16 samples"""
+        self._audio_len = 0
         silence_frames = 0
         speaking_started = False
-        
+
         try:
             while True:
                 try:
-                    data = self.audio_queue.get(timeout=0.1)
-                    volume = self._calculate_volume(data)
-                    
-                    if volume > self.silence_threshold:
-                        speaking_started = True
-                        silence_frames = 0
-                        audio_frames.append(data)
-                    else:
-                        if speaking_started:
-                            silence_frames += 1
-                            audio_frames.append(data)
-                            
-                            silence_duration = (silence_frames * self.chunk_size) / self.sample_rate
-                            if silence_duration > self.silence_duration:
-                                break
-                        
-                except Empty:
-                    await asyncio.sleep(0.01)
+                    # Woken by call_soon_threadsafe the moment a chunk
+                    # arrives; no polling interval to add latency
+                    data = await asyncio.wait_for(
+                        self.audio_queue.get(),
+                        timeout=self.silence_duration + 1.0)
+                except asyncio.TimeoutError:
+                    # Capture stalled; treat as end of utterance if one
+                    # was in progress, otherwise keep waiting for speech
+                    if speaking_started:
+                        break
                     continue
-                    
+
+                if self._chunk_energy(data) > self._silence_sq:
+                    speaking_started = True
+                    silence_frames = 0
+                    if not self._append_audio(data):
+                        break
+                else:
+                    if speaking_started:
+                        silence_frames += 1
+                        if not self._append_audio(data):
+                            break
+
+                        silence_duration = (silence_frames * self.chunk_size) / self.sample_rate
+                        if silence_duration > self.silence_duration:
+                            break
+
         finally:
             # Clear remaining queue
             while not self.audio_queue.empty():
-                try:
-                    self.audio_queue.get_nowait()
-                except Empty:
-                    break
-        
-        if not audio_frames:
+                self.audio_queue.get_nowait()
+
+        if self._audio_len == 0:
             return None
-            
+
         # Check minimum audio length
-        total_duration = (len(audio_frames) * self.chunk_size) / self.sample_rate
-        if total_duration < self.min_audio_length:
+        if self._audio_len / self.sample_rate < self.min_audio_length:
             return None
-        
-        return b''.join(audio_frames)
+
+        return self._audio_buf[:self._audio_len]
     
+    def _chunk_energy(self, data) -> float:
+        """Mean-square energy of an int16 chunk
+
+        One np.dot reduction over the widened samples; the VAD compares it
+        against _silence_sq, so no sqrt or intermediate arrays are needed.
+        """
+        samples = np.frombuffer(data, dtype=np.int16).astype(np.int64)
+        if samples.size == 0:
+            return 0.0
+        return float(np.dot(samples, samples)) / samples.size
+
     def _calculate_volume(self, data):
-        """Calculate volume level of audio data"""
-        audio_data = np.frombuffer(data, dtype=np.int16)
-        return np.sqrt(np.mean(audio_data**2))
+        """Calculate RMS volume of audio data (display/debug use; the VAD
+        hot path compares energies via _chunk_energy instead)"""
+        return float(np.sqrt(self._chunk_energy(data)))
     
     def _save_audio_data(self, audio_data, filename):
-        """Save audio data to WAV file"""
+        """Save raw int16 audio data to a WAV file (debug dumps only;
+        the recognition path feeds the model in-memory)"""
         with wave.open(filename, 'wb') as wav_file:
             wav_file.setnchannels(self.channels)
-            wav_file.setsampwidth(self.audio.get_sample_size(self.format))
+            wav_file.setsampwidth(self._sample_width)
             wav_file.setframerate(self.sample_rate)
             wav_file.writeframes(audio_data)
     
@@ -278,9 +428,18 @@ class EnhancedVoiceRecognizer:
                 await asyncio.sleep(1)
     
     def list_audio_devices(self):
-        """List available audio input devices"""
+        """List available audio input devices
+
+        The per-device info queries are FFI round trips, so the result is
+        memoized and only rebuilt when the device count changes (device
+        hot-plug shows up as a count change).
+        """
+        count = self.audio.get_device_count()
+        if self._device_cache is not None and self._device_cache[0] == count:
+            return self._device_cache[1]
+
         devices = []
-        for i in range(self.audio.get_device_count()):
+        for i in range(count):
             info = self.audio.get_device_info_by_index(i)
             if info['maxInputChannels'] > 0:
                 devices.append({
@@ -289,6 +448,7 @@ class EnhancedVoiceRecognizer:
                     'channels': info['maxInputChannels'],
                     'sample_rate': info['defaultSampleRate']
                 })
+        self._device_cache = (count, devices)
         return devices
     
     def get_model_info(self):
@@ -299,3 +459,8 @@ class EnhancedVoiceRecognizer:
             'device': self.device,
             'language': self.language
         }
+
+    def close(self):
+        """Release the transcription executor and audio resources"""
+        self._executor.shutdown(wait=False)
+        self.audio.terminate()
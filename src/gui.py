@@ -23,11 +23,16 @@ class VoiceControlGUI:
         # GUI state
         self.is_listening = False
         self.recognition_task = None
+        self._closed = False
         
         # Audio meter state
         self.audio_monitor_active = False
         self.audio_monitor_thread = None
         self.current_audio_level = 0
+
+        # Coalesced recognition-text updates (see _queue_recognition_text)
+        self._pending_text = []
+        self._flush_scheduled = False
         
         # Create main window
         self.root = tk.Tk()
@@ -359,9 +364,8 @@ class VoiceControlGUI:
                     
                 if text:
                     # Update GUI
-                    self.recognition_text.insert(tk.END, f"{text}\n")
-                    self.recognition_text.see(tk.END)
-                    
+                    self._queue_recognition_text(f"{text}\n")
+
                     # Process command
                     await self._process_recognition(text)
                     
@@ -376,9 +380,33 @@ class VoiceControlGUI:
         except Exception as e:
             self.logger.error(f"Command processing error: {e}")
             # Show error in GUI
-            self.recognition_text.insert(tk.END, f"Error processing command: {e}\n")
-            self.recognition_text.see(tk.END)
+            self._queue_recognition_text(f"Error processing command: {e}\n")
     
+    def _queue_recognition_text(self, text: str):
+        """Queue text for the recognition display
+
+        Every Tk text insert relayouts the widget and refreshes the
+        scrollbar, so rapid dictation output is coalesced and flushed as
+        one insert per 50 ms instead of one per recognized chunk.
+        """
+        self._pending_text.append(text)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(50, self._flush_recognition_text)
+
+    def _flush_recognition_text(self):
+        """Flush queued text to the recognition display in a single insert"""
+        self._flush_scheduled = False
+        if not self._pending_text:
+            return
+        try:
+            batch = "".join(self._pending_text)
+            self._pending_text.clear()
+            self.recognition_text.insert(tk.END, batch)
+            self.recognition_text.see(tk.END)
+        except tk.TclError:
+            pass  # window already destroyed
+
     def _start_audio_monitor(self):
         """Start audio level monitoring"""
         if not self.audio_monitor_active:
@@ -519,20 +547,35 @@ class VoiceControlGUI:
         """Handle window closing"""
         if self.is_listening:
             self._stop_listening()
+        if hasattr(self.voice_recognizer, 'close'):
+            self.voice_recognizer.close()
+        self._closed = True
         self.root.destroy()
     
     async def run(self):
-        """Run the GUI"""
-        def tk_update():
-            try:
-                self.root.update()
-            except tk.TclError:
-                return False
-            return True
-        
+        """Run the GUI alongside the asyncio loop
+
+        The old loop called root.update() on a fixed 10 ms timer — 100
+        wakeups per second even with nothing to do. This pump drains all
+        pending Tk events without blocking, yields straight back to
+        asyncio while events keep arriving, and only backs off to a
+        longer idle sleep when the Tk queue was empty.
+        """
+        import _tkinter
+
+        flags = _tkinter.ALL_EVENTS | _tkinter.DONT_WAIT
         try:
-            while tk_update():
-                await asyncio.sleep(0.01)
+            # dooneevent keeps returning 0 after the window is destroyed
+            # rather than raising TclError the way update() did, so the
+            # _closed flag set by _on_closing is the loop's exit condition
+            while not self._closed:
+                processed = 0
+                try:
+                    while self.root.tk.dooneevent(flags):
+                        processed += 1
+                except tk.TclError:
+                    break  # interpreter torn down
+                await asyncio.sleep(0 if processed else 0.05)
         except Exception as e:
             self.logger.error(f"GUI error: {e}")
     
@@ -170,8 +170,7 @@ class KeystrokeManager:
             self.logger.debug(f"Typing text: {text[:50]}...")
             
             # Use thread executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._type_text_sync, text, delay)
+            await asyncio.to_thread(self._type_text_sync, text, delay)
             
         except Exception as e:
             self.logger.error(f"Error typing text: {e}")
@@ -182,7 +181,16 @@ class KeystrokeManager:
         if self.controller is None:
             self.logger.warning("Controller not available, cannot type text")
             return
-            
+
+        if delay <= 0:
+            # One call hands the whole string to the OS input subsystem
+            # instead of a per-character inject + sleep
+            try:
+                self.controller.type(text)
+            except Exception as e:
+                self.logger.warning(f"Failed to type text batch: {e}")
+            return
+
         for char in text:
             try:
                 self.controller.type(char)
@@ -212,10 +220,7 @@ class KeystrokeManager:
                         modifier_keys.append(self.key_mappings[mod.lower()])
             
             # Send key combination
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, self._send_key_sync, key_obj, modifier_keys
-            )
+            await asyncio.to_thread(self._send_key_sync, key_obj, modifier_keys)
             
         except Exception as e:
             self.logger.error(f"Error sending key '{key}': {e}")
@@ -8,8 +8,6 @@ import logging
 import numpy as np
 import whisper
 import pyaudio
-import wave
-import tempfile
 import threading
 from queue import Queue, Empty
 from typing import AsyncGenerator, Optional
@@ -161,25 +159,21 @@ class VoiceRecognizer:
     async def _transcribe_audio(self, audio_data: bytes) -> str:
         """Transcribe audio data using the configured Whisper engine"""
         try:
-            # Save audio to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                # Create WAV file
-                with wave.open(temp_file.name, 'wb') as wav_file:
-                    wav_file.setnchannels(self.channels)
-                    wav_file.setsampwidth(self.audio.get_sample_size(self.format))
-                    wav_file.setframerate(self.sample_rate)
-                    wav_file.writeframes(audio_data)
-                
-                # Transcribe based on the engine type
-                loop = asyncio.get_event_loop()
-                
-                if self.model_type == 'faster-whisper':
-                    result = await loop.run_in_executor(None, self._transcribe_faster_whisper, temp_file.name)
-                else:
-                    result = await loop.run_in_executor(None, self._transcribe_standard_whisper, temp_file.name)
-                
-                return result
-                
+            # Both engines accept a 16 kHz mono float32 array directly.
+            # Converting in-process avoids the per-utterance WAV tempfile
+            # and the ffmpeg subprocess whisper.load_audio would spawn to
+            # read it back.
+            audio = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
+
+            loop = asyncio.get_event_loop()
+
+            if self.model_type == 'faster-whisper':
+                result = await loop.run_in_executor(None, self._transcribe_faster_whisper, audio)
+            else:
+                result = await loop.run_in_executor(None, self._transcribe_standard_whisper, audio)
+
+            return result
+
         except Exception as e:
             self.logger.error(f"Transcription error: {e}")
             return ""
@@ -255,14 +249,17 @@ class VoiceRecognizer:
             self.logger.error(f"Error transcribing file {file_path}: {e}")
             return ""
     
-    def _transcribe_faster_whisper(self, file_path: str) -> str:
-        """Transcribe using Faster-Whisper"""
+    def _transcribe_faster_whisper(self, audio) -> str:
+        """Transcribe using Faster-Whisper
+
+        Accepts either a file path or a float32 PCM ndarray.
+        """
         try:
             beam_size = self.config.get('whisper.beam_size', 5)
             best_of = self.config.get('whisper.best_of', 5)
-            
+
             segments, info = self.model.transcribe(
-                file_path,
+                audio,
                 language=self.language,
                 beam_size=beam_size,
                 best_of=best_of,
@@ -283,11 +280,14 @@ class VoiceRecognizer:
             self.logger.error(f"Faster-Whisper transcription error: {e}")
             return ""
     
-    def _transcribe_standard_whisper(self, file_path: str) -> str:
-        """Transcribe using standard Whisper"""
+    def _transcribe_standard_whisper(self, audio) -> str:
+        """Transcribe using standard Whisper
+
+        Accepts either a file path or a float32 PCM ndarray.
+        """
         try:
             result = self.model.transcribe(
-                file_path,
+                audio,
                 language=self.language,
                 temperature=0.0,
                 best_of=5,
@@ -328,6 +328,14 @@ class VoiceRecognizer:
         try:
             import whisper
             self.model = whisper.load_model(model_size, device=self.device)
+            if self.device == 'cuda':
+                # TF32 tensor-core matmul on Ampere+ costs <1 ULP accuracy;
+                # half precision is opt-out via whisper.fp16
+                torch.set_float32_matmul_precision('high')
+                torch.backends.cuda.matmul.allow_tf32 = True
+                torch.backends.cudnn.allow_tf32 = True
+                if self.config.get('whisper.fp16', True):
+                    self.model = self.model.half()
             self.logger.info("✅ Standard Whisper model loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load Whisper model: {e}")